@@ -4,6 +4,7 @@ Centralized configuration for magic numbers, strings, and settings
 """
 import os
 import boto3
+from botocore.config import Config
 from functools import lru_cache
 
 # Query Configuration
@@ -15,6 +16,17 @@ MIN_QUERY_LIMIT = 1
 COMPARE_INDEX_NAME = "CompareDistrictsIndex"
 GSI_TOWN_INDEX_NAME = "GSI_TOWN"
 
+# Shared botocore settings for DynamoDB clients and resources. Keep-alive and a
+# larger pool let warm Lambda invocations reuse open HTTPS connections instead
+# of paying a new TLS handshake per request.
+DYNAMODB_CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    retries={'mode': 'standard', 'max_attempts': 3},
+    connect_timeout=2,
+    read_timeout=5,
+)
+
 # DoS Protection - Maximum items to fetch from DynamoDB in a single operation
 # This prevents expensive queries that could exhaust resources
 MAX_DYNAMODB_FETCH_LIMIT = 1000
@@ -22,7 +34,7 @@ MAX_DYNAMODB_FETCH_LIMIT = 1000
 # Salary Configuration
 DEFAULT_SCHOOL_YEAR = "2021-2022"
 # ENFORCE: Only B (Bachelor's), M (Master's), and D (Doctorate) education levels are allowed
-VALID_EDUCATION_LEVELS = {'B', 'M', 'D'}
+VALID_EDUCATION_LEVELS = frozenset({'B', 'M', 'D'})
 MIN_STEP = 1
 
 # MAX_STEP and VALID_CREDITS are loaded dynamically from DynamoDB metadata
@@ -44,7 +56,7 @@ def _get_metadata():
         if not table_name:
             return None
 
-        dynamodb = boto3.resource('dynamodb')
+        dynamodb = boto3.resource('dynamodb', config=DYNAMODB_CLIENT_CONFIG)
         table = dynamodb.Table(table_name)
 
         response = table.get_item(
@@ -72,6 +84,7 @@ def get_max_step() -> int:
         return int(metadata.get('max_step', _MAX_STEP_FALLBACK))
     return _MAX_STEP_FALLBACK
 
+@lru_cache(maxsize=1)
 def get_valid_credits() -> set:
     """
     Get valid credit values from DynamoDB metadata's edu_credit_combos array.
@@ -111,13 +124,13 @@ MAX_STEP = _MAX_STEP_FALLBACK  # Deprecated: Use get_max_step() instead
 VALID_CREDITS = _VALID_CREDITS_FALLBACK  # Deprecated: Use get_valid_credits() instead
 
 # District Type Configuration
-VALID_DISTRICT_TYPES = {
+VALID_DISTRICT_TYPES = frozenset({
     'municipal',
     'regional_academic',
     'regional_vocational',
     'county_agricultural',
     'charter'
-}
+})
 
 # Pagination
 DEFAULT_OFFSET = 0
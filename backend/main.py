@@ -3,6 +3,7 @@ MA Teachers Contracts API - Main Application
 """
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from contextlib import asynccontextmanager
 import os
@@ -34,6 +35,16 @@ logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
 
+# Serialize responses with orjson when it is installed; it is several times
+# faster than the stdlib encoder on large salary comparison payloads
+try:
+    import orjson  # noqa: F401
+    default_response_class = ORJSONResponse
+except ImportError:
+    # orjson not installed - fall back to the standard JSON response
+    default_response_class = JSONResponse
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan - startup and shutdown logic"""
@@ -47,7 +58,8 @@ app = FastAPI(
     title="MA Teachers Contracts API",
     description="API for looking up Massachusetts teachers contracts",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=default_response_class
 )
 
 # Add rate limiter state
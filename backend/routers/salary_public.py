@@ -16,6 +16,7 @@ from services.salary_service_optimized import (
 # Use optimized schedule reader for district schedule queries
 from services.salary_service_optimized import get_salary_schedule_for_district_optimized as get_salary_schedule_for_district
 from rate_limiter import limiter, GENERAL_RATE_LIMIT
+from config import DYNAMODB_CLIENT_CONFIG
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -23,7 +24,7 @@ logger = logging.getLogger(__name__)
 # Initialize DynamoDB for salary data
 # AWS_REGION is automatically provided by Lambda runtime, fallback to us-east-1 for local dev
 AWS_REGION = os.getenv('AWS_REGION', 'us-east-1')
-dynamodb = boto3.resource('dynamodb', region_name=AWS_REGION)
+dynamodb = boto3.resource('dynamodb', region_name=AWS_REGION, config=DYNAMODB_CLIENT_CONFIG)
 TABLE_NAME = os.getenv('DYNAMODB_TABLE_NAME')
 
 main_table = dynamodb.Table(TABLE_NAME) if TABLE_NAME else None
@@ -1,61 +1,96 @@
 from datetime import datetime
-from typing import List, Optional
-from pydantic import BaseModel, Field, field_validator, ValidationError
+from typing import Annotated, List, Literal, Optional, get_args
+from pydantic import AfterValidator, BaseModel, BeforeValidator, ConfigDict, Field, StringConstraints, ValidationError
 import re
+import string
 
 # Validation constants
 # Allow alphanumeric, spaces, hyphens (including em dash), apostrophes, periods, ampersands, commas, parentheses, colons, and hash
 SAFE_TEXT_PATTERN = re.compile(r'^[a-zA-Z0-9\s\-\'.&,():#—/]+$')
 DISTRICT_TYPE_PATTERN = re.compile(r'^[a-z_]+$')
-VALID_DISTRICT_TYPES = {
+DistrictTypeLiteral = Literal[
     'municipal',
     'regional_academic',
     'regional_vocational',
     'county_agricultural',
     'charter',
     'other'
-}
+]
+VALID_DISTRICT_TYPES = frozenset(get_args(DistrictTypeLiteral))
+# Canonical spelling of each district type, so already-normalized input is
+# returned as-is without strip()/lower() copies
+_CANONICAL_DISTRICT_TYPES = {t: t for t in VALID_DISTRICT_TYPES}
 MAX_TOWNS_PER_DISTRICT = 50
 
+# ASCII bytes accepted by SAFE_TEXT_PATTERN. Deleting them with bytes.translate
+# leaves nothing for a safe value, which is a single C-level scan instead of a
+# regex match.
+_SAFE_TEXT_ASCII_CHARS = (
+    string.ascii_letters
+    + string.digits
+    + ''.join(c for c in map(chr, range(128)) if c.isspace())  # same set as \s
+    + "-'.&,():#/"
+)
+_SAFE_TEXT_ASCII_BYTES = _SAFE_TEXT_ASCII_CHARS.encode('ascii')
+# Non-ASCII input gets the same treatment with a str.translate deletion table:
+# the em dash plus every non-ASCII code point that \s matches (str.isspace)
+_SAFE_TEXT_DELETE_TABLE = dict.fromkeys(
+    map(ord, _SAFE_TEXT_ASCII_CHARS + '—\x85\xa0\u1680\u2028\u2029\u202f\u205f\u3000'),
+    None
+)
+_SAFE_TEXT_DELETE_TABLE.update(dict.fromkeys(range(0x2000, 0x200b), None))
+
+_SAFE_TEXT_HINT = (
+    'Only alphanumeric, spaces, hyphens, apostrophes, periods, colons, '
+    'ampersands, commas, parentheses, forward slashes, and hash symbols are allowed.'
+)
+_TOWN_TEXT_HINT = (
+    'Only alphanumeric, spaces, hyphens, apostrophes, periods, colons, '
+    'ampersands, commas, parentheses, and hash symbols are allowed.'
+)
+
+
+def _is_safe_text(v: str) -> bool:
+    """Return True if the whole value matches SAFE_TEXT_PATTERN"""
+    if not v:
+        return False
+    if v.isascii():
+        return not v.encode('ascii').translate(None, _SAFE_TEXT_ASCII_BYTES)
+    return not v.translate(_SAFE_TEXT_DELETE_TABLE)
+
 
 # Reusable validator functions
-def validate_name_field(v: Optional[str]) -> Optional[str]:
-    """Validate district name contains only safe characters"""
-    if v is None:
-        return v
+def _make_safe_text_validator(label: str, required: bool):
+    """
+    Build a validator for a free-text field restricted to SAFE_TEXT_PATTERN
 
-    if not v.strip():
-        raise ValueError('District name cannot be empty')
+    Required fields reject blank values; optional fields turn them into None.
+    Error messages are built once here rather than on every failed validation.
+    """
+    empty_message = f'{label} cannot be empty'
+    invalid_message = f'{label} contains invalid characters. {_SAFE_TEXT_HINT}'
 
-    v = v.strip()
+    def validate(v: Optional[str]) -> Optional[str]:
+        if v is None:
+            return v
 
-    if not SAFE_TEXT_PATTERN.match(v):
-        raise ValueError(
-            'District name contains invalid characters. '
-            'Only alphanumeric, spaces, hyphens, apostrophes, periods, colons, '
-            'ampersands, commas, parentheses, forward slashes, and hash symbols are allowed.'
-        )
-
-    return v
+        v = v.strip()
+        if not v:
+            if required:
+                raise ValueError(empty_message)
+            return None
 
+        if not _is_safe_text(v):
+            raise ValueError(invalid_message)
 
-def validate_address_field(v: Optional[str]) -> Optional[str]:
-    """Validate main address contains only safe characters"""
-    if v is None:
         return v
 
-    v = v.strip()
-    if not v:
-        return None
+    validate.__doc__ = f'Validate {label[0].lower()}{label[1:]} contains only safe characters'
+    return validate
 
-    if not SAFE_TEXT_PATTERN.match(v):
-        raise ValueError(
-            'Main address contains invalid characters. '
-            'Only alphanumeric, spaces, hyphens, apostrophes, periods, colons, '
-            'ampersands, commas, parentheses, forward slashes, and hash symbols are allowed.'
-        )
 
-    return v
+validate_name_field = _make_safe_text_validator('District name', required=True)
+validate_address_field = _make_safe_text_validator('Main address', required=False)
 
 
 def validate_url_field(v: Optional[str]) -> Optional[str]:
@@ -68,7 +103,7 @@ def validate_url_field(v: Optional[str]) -> Optional[str]:
         return None
 
     # Basic URL validation - must start with http:// or https://
-    if not (v.startswith('http://') or v.startswith('https://')):
+    if not v.startswith(('http://', 'https://')):
         raise ValueError('District URL must start with http:// or https://')
 
     return v
@@ -85,38 +120,45 @@ def validate_towns_field(v: Optional[List[str]]) -> Optional[List[str]]:
     if len(v) > MAX_TOWNS_PER_DISTRICT:
         raise ValueError(f'Too many towns (max {MAX_TOWNS_PER_DISTRICT})')
 
-    validated_towns = []
-    for town in v:
-        if not town or not town.strip():
-            continue  # Skip empty entries
+    # Strip, drop empty entries and remove duplicates (keeping first-seen order)
+    # up front so each distinct town is only validated once
+    stripped = (town.strip() for town in v if town)
+    validated_towns = list(dict.fromkeys(town for town in stripped if town))
 
-        town = town.strip()
+    # Fast path: every town is safe exactly when their concatenation is, so one
+    # translate call covers the whole list. Only fall back to checking towns
+    # one by one to report which entry failed.
+    if not validated_towns or (
+        max(map(len, validated_towns)) <= 100 and _is_safe_text(''.join(validated_towns))
+    ):
+        return validated_towns
 
+    for town in validated_towns:
         if len(town) > 100:
             raise ValueError(f'Town name too long (max 100 characters): {town[:50]}...')
 
-        if not SAFE_TEXT_PATTERN.match(town):
-            raise ValueError(
-                f'Town name contains invalid characters: {town[:50]}... '
-                'Only alphanumeric, spaces, hyphens, apostrophes, periods, colons, '
-                'ampersands, commas, parentheses, and hash symbols are allowed.'
-            )
-
-        validated_towns.append(town)
+        if not _is_safe_text(town):
+            raise ValueError(f'Town name contains invalid characters: {town[:50]}... {_TOWN_TEXT_HINT}')
 
     return validated_towns
 
 
-def validate_district_type_field(v: Optional[str]) -> Optional[str]:
-    """Validate district type is from allowed list"""
-    if v is None:
+def normalize_district_type_field(v):
+    """Normalize district type input (strip and lowercase) and check it is from allowed list"""
+    if not isinstance(v, str):
         return v
 
-    if not v.strip():
+    canonical = _CANONICAL_DISTRICT_TYPES.get(v)
+    if canonical is not None:
+        return canonical
+
+    v = v.strip()
+    if not v:
         raise ValueError('District type cannot be empty')
 
-    v = v.strip().lower()
+    v = v.lower()
 
+    # Checked here as well as by the Literal so the API keeps its own message
     if v not in VALID_DISTRICT_TYPES:
         raise ValueError(
             f'Invalid district type: {v}. '
@@ -126,6 +168,18 @@ def validate_district_type_field(v: Optional[str]) -> Optional[str]:
     return v
 
 
+# Validated field types shared by the create, update and response schemas, so
+# each validator is declared once instead of being re-wired on every class.
+# Length limits sit inside the type so they are checked before the validator.
+DistrictName = Annotated[str, StringConstraints(min_length=1, max_length=255), AfterValidator(validate_name_field)]
+MainAddress = Annotated[str, StringConstraints(max_length=500), AfterValidator(validate_address_field)]
+DistrictUrl = Annotated[str, StringConstraints(max_length=500), AfterValidator(validate_url_field)]
+TownList = Annotated[List[str], AfterValidator(validate_towns_field)]
+# The Literal keeps the allowed district types in the JSON schema; the before-validator
+# rejects anything else first with the API's own error message
+DistrictType = Annotated[DistrictTypeLiteral, BeforeValidator(normalize_district_type_field)]
+
+
 class DistrictTownBase(BaseModel):
     """Base schema for district town"""
     town_name: str = Field(..., min_length=1, max_length=100)
@@ -138,66 +192,50 @@ class DistrictTownCreate(DistrictTownBase):
 
 class DistrictTownResponse(DistrictTownBase):
     """Schema for district town response"""
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     id: int
     district_id: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class DistrictBase(BaseModel):
     """Base schema for district"""
-    name: str = Field(..., min_length=1, max_length=255)
-    main_address: Optional[str] = Field(None, max_length=500)
-    district_url: Optional[str] = Field(None, max_length=500)
+    name: DistrictName
+    main_address: Optional[MainAddress] = None
+    district_url: Optional[DistrictUrl] = None
     contract_pdf: Optional[str] = Field(None, max_length=500)
 
-    # Use reusable validators
-    _validate_name = field_validator('name')(validate_name_field)
-    _validate_main_address = field_validator('main_address')(validate_address_field)
-    _validate_district_url = field_validator('district_url')(validate_url_field)
-
 class DistrictCreate(DistrictBase):
     """Schema for creating a district"""
-    towns: List[str] = Field(default_factory=list, description="List of town names")
-    district_type: str = Field(..., description="Type of district (e.g. municipal, regional_academic, etc.)")
-
-    # Use reusable validators
-    _validate_towns = field_validator('towns')(validate_towns_field)
-    _validate_district_type = field_validator('district_type')(validate_district_type_field)
+    towns: TownList = Field(default_factory=list, description="List of town names")
+    district_type: DistrictType = Field(..., description="Type of district (e.g. municipal, regional_academic, etc.)")
 
 
 class DistrictUpdate(BaseModel):
     """Schema for updating a district"""
-    name: Optional[str] = Field(None, min_length=1, max_length=255)
-    main_address: Optional[str] = Field(None, max_length=500)
-    district_url: Optional[str] = Field(None, max_length=500)
-    towns: Optional[List[str]] = Field(None, description="List of town names")
-    district_type: Optional[str] = Field(None, description="Type of district (e.g. municipal, regional_academic, etc.)")
-
-    # Use reusable validators
-    _validate_name = field_validator('name')(validate_name_field)
-    _validate_main_address = field_validator('main_address')(validate_address_field)
-    _validate_district_url = field_validator('district_url')(validate_url_field)
-    _validate_towns = field_validator('towns')(validate_towns_field)
-    _validate_district_type = field_validator('district_type')(validate_district_type_field)
+    name: Optional[DistrictName] = None
+    main_address: Optional[MainAddress] = None
+    district_url: Optional[DistrictUrl] = None
+    towns: Optional[TownList] = Field(None, description="List of town names")
+    district_type: Optional[DistrictType] = Field(None, description="Type of district (e.g. municipal, regional_academic, etc.)")
 
 
 class DistrictResponse(DistrictBase):
     """Schema for district response"""
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     id: str  # Changed from int to str for DynamoDB UUIDs
     towns: List[str] = Field(default_factory=list, description="List of town names")
     district_type: str = Field(..., description="Type of district (e.g. municipal, regional_academic, etc.)")
     created_at: str  # Changed from datetime to str for ISO format strings
     updated_at: str  # Changed from datetime to str for ISO format strings
 
-    class Config:
-        from_attributes = True
-
 
 class DistrictListResponse(BaseModel):
     """Schema for paginated district list response"""
+    model_config = ConfigDict(frozen=True)
+
     data: List[DistrictResponse]
     total: int
     limit: int
@@ -7,13 +7,14 @@ import os
 import sys
 from pathlib import Path
 import boto3
-from dotenv import load_dotenv
-from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.types import TypeDeserializer
 
-# Load environment variables from backend/.env
-backend_dir = Path(__file__).parent.parent
-env_path = backend_dir / '.env'
-load_dotenv(dotenv_path=env_path)
+# Load environment variables from backend/.env, unless the environment
+# (e.g. a container or CI job) already provides them
+if not os.environ.get('DYNAMODB_TABLE_NAME'):
+    from dotenv import load_dotenv
+    backend_dir = Path(__file__).parent.parent
+    load_dotenv(dotenv_path=backend_dir / '.env')
 
 # Get configuration
 table_name = os.environ.get('DYNAMODB_TABLE_NAME')
@@ -23,18 +24,29 @@ if not table_name:
     print("ERROR: DYNAMODB_TABLE_NAME not set in backend/.env")
     sys.exit(1)
 
-# Initialize DynamoDB
-dynamodb = boto3.resource('dynamodb', region_name=aws_region)
-table = dynamodb.Table(table_name)
+# Initialize DynamoDB (low-level client; this script only runs one query)
+client = boto3.client('dynamodb', region_name=aws_region)
+deserializer = TypeDeserializer()
 
 print(f"Checking METADATA#AVAILABILITY entries in {table_name}...\n")
 
 # Query all METADATA#AVAILABILITY items
-response = table.query(
-    KeyConditionExpression=Key('PK').eq('METADATA#AVAILABILITY')
+paginator = client.get_paginator('query')
+pages = paginator.paginate(
+    TableName=table_name,
+    KeyConditionExpression='PK = :pk',
+    ExpressionAttributeValues={':pk': {'S': 'METADATA#AVAILABILITY'}},
+    # Only fetch the attributes printed below; the district count is stored
+    # on the item so the (large) districts map is not transferred
+    ProjectionExpression='SK, school_year, #p, num_districts',
+    ExpressionAttributeNames={'#p': 'period'}
 )
 
-items = response.get('Items', [])
+items = [
+    {key: deserializer.deserialize(value) for key, value in item.items()}
+    for page in pages
+    for item in page.get('Items', [])
+]
 
 if not items:
     print("❌ No METADATA#AVAILABILITY entries found!")
@@ -47,8 +59,15 @@ else:
         sk = item.get('SK', '')
         year = item.get('school_year', 'N/A')
         period = item.get('period', 'N/A')
-        districts = item.get('districts', {})
-        num_districts = len(districts)
+        num_districts = item.get('num_districts')
+        if num_districts is None:
+            # Items written before num_districts existed: count the map instead
+            response = client.get_item(
+                TableName=table_name,
+                Key={'PK': {'S': 'METADATA#AVAILABILITY'}, 'SK': {'S': sk}},
+                ProjectionExpression='districts'
+            )
+            num_districts = len(response.get('Item', {}).get('districts', {}).get('M', {}))
 
         print(f"  SK: {sk}")
         print(f"    Year: {year}")
@@ -7,12 +7,13 @@ import os
 import sys
 from pathlib import Path
 import boto3
-from dotenv import load_dotenv
 
-# Load environment variables from backend/.env
-backend_dir = Path(__file__).parent.parent
-env_path = backend_dir / '.env'
-load_dotenv(dotenv_path=env_path)
+# Load environment variables from backend/.env, unless the environment
+# (e.g. a container or CI job) already provides them
+if not os.environ.get('S3_BUCKET_NAME'):
+    from dotenv import load_dotenv
+    backend_dir = Path(__file__).parent.parent
+    load_dotenv(dotenv_path=backend_dir / '.env')
 
 # Get configuration
 bucket_name = os.environ.get('S3_BUCKET_NAME')
@@ -28,36 +29,46 @@ s3_client = boto3.client('s3', region_name=aws_region)
 print(f"Checking backup files in s3://{bucket_name}/contracts/applied_data/...\n")
 
 try:
-    # List all backup files
-    response = s3_client.list_objects_v2(
+    # List all backup files page by page (list_objects_v2 returns at most
+    # 1000 keys per call), counting as we go instead of building a full list
+    paginator = s3_client.get_paginator('list_objects_v2')
+    pages = paginator.paginate(
         Bucket=bucket_name,
-        Prefix='contracts/applied_data/'
+        Prefix='contracts/applied_data/',
+        PaginationConfig={'PageSize': 1000}
     )
 
-    if 'Contents' not in response:
+    file_count = 0
+    first_files = []
+    for page in pages:
+        for obj in page.get('Contents', []):
+            if not obj['Key'].endswith('.json'):
+                continue
+            file_count += 1
+            if len(first_files) < 10:
+                first_files.append(obj['Key'])
+
+    if file_count == 0:
         print("❌ No backup files found!")
         sys.exit(0)
 
-    files = [obj['Key'] for obj in response['Contents'] if obj['Key'].endswith('.json')]
-
-    print(f"✓ Found {len(files)} backup JSON files\n")
+    print(f"✓ Found {file_count} backup JSON files\n")
 
-    if len(files) > 0:
-        print("First 10 files:")
-        for f in sorted(files[:10]):
-            filename = f.split('/')[-1]
-            print(f"  - {filename}")
+    print("First 10 files:")
+    for f in sorted(first_files):
+        filename = f.split('/')[-1]
+        print(f"  - {filename}")
 
-        if len(files) > 10:
-            print(f"  ... and {len(files) - 10} more")
+    if file_count > 10:
+        print(f"  ... and {file_count - 10} more")
 
-    print(f"\nTotal backup files: {len(files)}")
+    print(f"\nTotal backup files: {file_count}")
     print(f"Expected: 156 (one per district)")
 
-    if len(files) < 156:
-        print(f"\n⚠️  Missing {156 - len(files)} backup files!")
+    if file_count < 156:
+        print(f"\n⚠️  Missing {156 - file_count} backup files!")
         print("This means not all districts have backups.")
-    elif len(files) == 156:
+    elif file_count == 156:
         print("\n✓ All 156 districts have backup files")
 
 except Exception as e:
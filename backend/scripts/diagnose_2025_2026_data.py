@@ -5,15 +5,17 @@ Diagnose 2025-2026 data issue
 
 import os
 import sys
+import time
 from pathlib import Path
 import boto3
-from dotenv import load_dotenv
-from boto3.dynamodb.conditions import Key, Attr
+from boto3.dynamodb.types import TypeDeserializer
 
-# Load environment variables
-backend_dir = Path(__file__).parent.parent
-env_path = backend_dir / '.env'
-load_dotenv(dotenv_path=env_path)
+# Load environment variables from backend/.env, unless the environment
+# (e.g. a container or CI job) already provides them
+if not os.environ.get('DYNAMODB_TABLE_NAME'):
+    from dotenv import load_dotenv
+    backend_dir = Path(__file__).parent.parent
+    load_dotenv(dotenv_path=backend_dir / '.env')
 
 table_name = os.environ.get('DYNAMODB_TABLE_NAME')
 aws_region = os.environ.get('AWS_REGION', 'us-east-1')
@@ -22,16 +24,24 @@ if not table_name:
     print("ERROR: DYNAMODB_TABLE_NAME not set")
     sys.exit(1)
 
-dynamodb = boto3.resource('dynamodb', region_name=aws_region)
-table = dynamodb.Table(table_name)
+# Low-level client: this script only issues a handful of requests
+client = boto3.client('dynamodb', region_name=aws_region)
+deserializer = TypeDeserializer()
+
+
+def deserialize(item):
+    """Convert a low-level DynamoDB item into plain Python values"""
+    return {key: deserializer.deserialize(value) for key, value in item.items()}
+
 
 print(f"Diagnosing 2025-2026 Full Year data in {table_name}...\n")
 
 # Get availability metadata
-response = table.get_item(
+response = client.get_item(
+    TableName=table_name,
     Key={
-        'PK': 'METADATA#AVAILABILITY',
-        'SK': 'YEAR#2025-2026#PERIOD#Full Year'
+        'PK': {'S': 'METADATA#AVAILABILITY'},
+        'SK': {'S': 'YEAR#2025-2026#PERIOD#Full Year'}
     }
 )
 
@@ -40,7 +50,7 @@ if 'Item' not in response:
     print("This means no salary data has been uploaded for this year/period")
     sys.exit(1)
 
-availability = response['Item']
+availability = deserialize(response['Item'])
 districts_with_data = availability.get('districts', {})
 district_ids = list(districts_with_data.keys())
 
@@ -51,23 +61,41 @@ print(f"District IDs: {district_ids[:10]}{'...' if len(district_ids) > 10 else '
 print("Fetching district details...\n")
 
 district_types = {}
-for district_id in district_ids:
-    response = table.get_item(
-        Key={
-            'PK': f'DISTRICT#{district_id}',
-            'SK': 'METADATA'
+keys = [
+    {'PK': {'S': f'DISTRICT#{district_id}'}, 'SK': {'S': 'METADATA'}}
+    for district_id in district_ids
+]
+
+# BatchGetItem accepts at most 100 keys per request
+for start in range(0, len(keys), 100):
+    request_items = {
+        table_name: {
+            'Keys': keys[start:start + 100],
+            'ProjectionExpression': '#n, district_type',
+            'ExpressionAttributeNames': {'#n': 'name'}
         }
-    )
+    }
+
+    attempt = 0
+    while request_items:
+        if attempt:
+            # Back off before retrying throttled keys instead of spinning
+            time.sleep(min(2 ** attempt * 0.05, 5))
+        response = client.batch_get_item(RequestItems=request_items)
+
+        for item in response.get('Responses', {}).get(table_name, []):
+            district = deserialize(item)
+            dtype = district.get('district_type', 'unknown')
+            name = district.get('name', 'unknown')
+            district_types[dtype] = district_types.get(dtype, 0) + 1
 
-    if 'Item' in response:
-        district = response['Item']
-        dtype = district.get('district_type', 'unknown')
-        name = district.get('name', district_id)
-        district_types[dtype] = district_types.get(dtype, 0) + 1
+            # Show first few
+            if sum(district_types.values()) <= 15:
+                print(f"  - {name}: {dtype}")
 
-        # Show first few
-        if len([d for d in district_types.values()]) <= 15:
-            print(f"  - {name}: {dtype}")
+        # Retry any keys DynamoDB could not process (throttling)
+        request_items = response.get('UnprocessedKeys')
+        attempt += 1
 
 print(f"\n{'='*60}")
 print("SUMMARY:")
@@ -81,27 +109,27 @@ print(f"\n{'='*60}")
 print("Expected vs Actual:")
 print(f"{'='*60}")
 
-# Get all regional/municipal districts
-all_response = table.scan(
-    FilterExpression=Attr('entity_type').eq('district')
+# Get all regional/municipal districts from the sparse GSI_METADATA index
+# (district metadata items only) rather than scanning the whole table
+paginator = client.get_paginator('query')
+pages = paginator.paginate(
+    TableName=table_name,
+    IndexName='GSI_METADATA',
+    KeyConditionExpression='SK = :sk',
+    ExpressionAttributeValues={':sk': {'S': 'METADATA'}},
+    ProjectionExpression='district_type'
 )
 
-all_districts = all_response['Items']
-while 'LastEvaluatedKey' in all_response:
-    all_response = table.scan(
-        FilterExpression=Attr('entity_type').eq('district'),
-        ExclusiveStartKey=all_response['LastEvaluatedKey']
-    )
-    all_districts.extend(all_response['Items'])
-
-regional_municipal = [
-    d for d in all_districts
-    if d.get('district_type', '').lower() in ['regional_academic', 'municipal']
-]
+regional_municipal_count = sum(
+    1
+    for page in pages
+    for item in page.get('Items', [])
+    if item.get('district_type', {}).get('S', '').lower() in ('regional_academic', 'municipal')
+)
 
-print(f"Total Regional/Municipal districts in system: {len(regional_municipal)}")
+print(f"Total Regional/Municipal districts in system: {regional_municipal_count}")
 print(f"Regional/Municipal with 2025-2026 data: {district_types.get('regional_academic', 0) + district_types.get('municipal', 0)}")
-print(f"Missing: {len(regional_municipal) - (district_types.get('regional_academic', 0) + district_types.get('municipal', 0))}")
+print(f"Missing: {regional_municipal_count - (district_types.get('regional_academic', 0) + district_types.get('municipal', 0))}")
 
 print(f"\n{'='*60}")
 if len(district_ids) == 156:
@@ -15,14 +15,20 @@ import sys
 import subprocess
 from pathlib import Path
 import boto3
+from boto3.dynamodb.conditions import Key
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add the backend directory to the path so we can import our modules
 backend_path = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_path))
 
 from services.dynamodb_district_service import DynamoDBDistrictService
-from schemas import DistrictCreate
+from schemas import DistrictCreate, DistrictUpdate
 from database import table
 
 # Load environment variables
@@ -32,9 +38,40 @@ TABLE_NAME = os.getenv('DYNAMODB_TABLE_NAME')
 
 
 def load_districts_json(filepath: str) -> dict:
-    """Load and parse the districts JSON file."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    """Load and parse the districts JSON file (with orjson when installed)."""
+    with open(filepath, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def load_existing_districts() -> dict:
+    """
+    Load every district's lowercase name and ID with one paginated GSI query.
+
+    Returns:
+        Dict mapping name_lower -> district_id
+    """
+    existing_by_name = {}
+    query_kwargs = {
+        'IndexName': 'GSI_METADATA',
+        'KeyConditionExpression': Key('SK').eq('METADATA'),
+        'ProjectionExpression': 'name_lower, district_id'
+    }
+
+    while True:
+        response = table.query(**query_kwargs)
+        for item in response.get('Items', []):
+            if item.get('name_lower') and item.get('district_id'):
+                existing_by_name[item['name_lower']] = item['district_id']
+
+        last_key = response.get('LastEvaluatedKey')
+        if not last_key:
+            break
+        query_kwargs['ExclusiveStartKey'] = last_key
+
+    return existing_by_name
 
 
 def import_districts(json_filepath: str, dry_run: bool = False):
@@ -61,6 +98,16 @@ def import_districts(json_filepath: str, dry_run: bool = False):
     # This prevents duplicates within the import file itself
     processed_districts_map = {}
 
+    # Look up existing districts once up front instead of querying per row
+    existing_by_name = {}
+    if not dry_run:
+        try:
+            existing_by_name = load_existing_districts()
+            print(f"Found {len(existing_by_name)} existing districts")
+        except Exception as query_error:
+            # If GSI query fails, fall back to checking processed map only
+            print(f"⚠️  Warning: Could not query GSI for existing districts: {query_error}")
+
     # Process each category of districts
     categories = [
         ('regional_academic', 'Regional Academic', 'regional_academic'),
@@ -127,35 +174,18 @@ def import_districts(json_filepath: str, dry_run: bool = False):
                         stats['skipped'] += 1
                         continue
 
-                    # Check if district exists in database using GSI
-                    from boto3.dynamodb.conditions import Key
-                    existing = None
-                    try:
-                        response = table.query(
-                            IndexName='GSI_METADATA',
-                            KeyConditionExpression=Key('SK').eq('METADATA') & Key('name_lower').eq(name_lower),
-                            Limit=1
-                        )
-                        if response.get('Items'):
-                            item = response['Items'][0]
-                            existing = {
-                                'id': item.get('district_id'),
-                                'name': item.get('name')
-                            }
-                    except Exception as query_error:
-                        # If GSI query fails, fall back to checking processed map only
-                        print(f"  ⚠️  Warning: Could not query GSI for {name}: {query_error}")
-
-                    if existing:
+                    district_id = existing_by_name.get(name_lower)
+
+                    if district_id:
                         # Update existing
-                        district_id = existing['id']
-                        from schemas import DistrictUpdate
-                        update_data = DistrictUpdate(
-                            name=name,
-                            main_address=address if address else None,
-                            district_url=district_url if district_url else None,
-                            towns=members if members else [],
-                            district_type=district_type
+                        # district_create already validated and normalized these
+                        # values, so build the update without re-running validators
+                        update_data = DistrictUpdate.model_construct(
+                            name=district_create.name,
+                            main_address=district_create.main_address,
+                            district_url=district_create.district_url,
+                            towns=district_create.towns,
+                            district_type=district_create.district_type
                         )
                         DynamoDBDistrictService.update_district(table, district_id, update_data)
                         print(f"  ✓ Updated: {name} (ID: {district_id})")
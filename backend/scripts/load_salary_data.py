@@ -2,18 +2,76 @@
 """
 Load salary data from JSON into DynamoDB
 New single-table design with metadata tracking and efficient GSIs
+
+Usage:
+    python3 load_salary_data.py [table_name]
+
+Large imports are dominated by pure-Python item building (string formatting
+and dict construction). The script has no C-extension requirements beyond
+boto3, so it also runs unchanged under PyPy, whose JIT speeds that loop up
+considerably:
+    pypy3 -m pip install boto3 python-dotenv
+    pypy3 load_salary_data.py [table_name]
+
+Records are streamed from the JSON file and written as they are read.
+Malformed records (missing fields, non-numeric credits/step/salary) are
+skipped and counted in the summary, so the metadata items are still written.
+If the file itself cannot be read to the end (e.g. truncated JSON), the load
+stops, reports how many items were already written, exits non-zero and does
+not write the metadata items or run normalization; fix the file and re-run.
+
+Optional packages (listed in requirements-dev.txt, not the Lambda package):
+    ijson       streams salary_data.json instead of loading it whole
+    rapidfuzz   scores fuzzy district name matches in C (same results)
+
+Environment:
+    SALARY_LOAD_WRITE_WORKERS   parallel BatchWriteItem workers (default 8)
+    SALARY_LOAD_SCAN_SEGMENTS   segments for the fallback districts scan (default 4)
 """
 
+import heapq
+import itertools
 import json
+import os
+import random
+import re
+import sys
+import time
+import unicodedata
 import boto3
 from pathlib import Path
 from collections import defaultdict
-from decimal import Decimal
-from boto3.dynamodb.conditions import Attr
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, List, NamedTuple, Set
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from boto3.dynamodb.types import TypeSerializer
 from datetime import datetime, UTC
 
-# Initialize DynamoDB
-dynamodb = boto3.resource('dynamodb')
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    from rapidfuzz import fuzz, process as fuzz_process
+except ImportError:
+    fuzz = fuzz_process = None
+
+# Initialize DynamoDB (low-level client: no resource-layer per-item
+# validation and copying; items are serialized once with TypeSerializer)
+dynamodb_client = boto3.client('dynamodb')
+
+# Parallel batch writes: number of concurrent BatchWriteItem workers and how
+# many times to retry items DynamoDB returns as unprocessed (throttling)
+WRITE_WORKERS = int(os.environ.get('SALARY_LOAD_WRITE_WORKERS', '8'))
+MAX_WRITE_RETRIES = 8
+
+# Number of parallel segments for the fallback districts scan
+SCAN_SEGMENTS = int(os.environ.get('SALARY_LOAD_SCAN_SEGMENTS', '4'))
+
+_serializer = TypeSerializer()
 
 def build_district_name_to_id_map(table_name):
     """
@@ -21,35 +79,51 @@ def build_district_name_to_id_map(table_name):
     Returns dict: {district_name_lower: district_id}
     """
     print(f"\nQuerying districts from table: {table_name}...")
-    table = dynamodb.Table(table_name)
 
     district_map = {}
 
-    try:
-        # Scan the table for all district metadata items
-        response = table.scan(
-            FilterExpression=Attr('entity_type').eq('district')
-        )
-
-        for item in response.get('Items', []):
-            district_id = item.get('district_id')
-            district_name = item.get('name', '')
-            if district_id and district_name:
-                # Store with lowercase name for matching
-                district_map[district_name.lower()] = district_id
-
-        # Handle pagination if needed
-        while 'LastEvaluatedKey' in response:
-            response = table.scan(
-                FilterExpression=Attr('entity_type').eq('district'),
-                ExclusiveStartKey=response['LastEvaluatedKey']
-            )
-            for item in response.get('Items', []):
-                district_id = item.get('district_id')
-                district_name = item.get('name', '')
+    def add_districts(pages):
+        for page in pages:
+            for item in page.get('Items', []):
+                district_id = item.get('district_id', {}).get('S')
+                district_name = item.get('name', {}).get('S', '')
                 if district_id and district_name:
+                    # Store with lowercase name for matching
                     district_map[district_name.lower()] = district_id
 
+    try:
+        # Query the sparse GSI_METADATA index (district metadata items only)
+        # instead of scanning and filtering the whole table
+        try:
+            add_districts(dynamodb_client.get_paginator('query').paginate(
+                TableName=table_name,
+                IndexName='GSI_METADATA',
+                KeyConditionExpression='SK = :sk',
+                ExpressionAttributeValues={':sk': {'S': 'METADATA'}},
+                ProjectionExpression='district_id, #n',
+                ExpressionAttributeNames={'#n': 'name'}
+            ))
+        except Exception as query_error:
+            print(f"  ⚠️  Could not query GSI_METADATA ({query_error}), scanning instead")
+
+        # Fallback: if the index is missing or returned nothing, scan the
+        # table in parallel segments
+        if not district_map:
+            def scan_segment(segment):
+                return list(dynamodb_client.get_paginator('scan').paginate(
+                    TableName=table_name,
+                    FilterExpression='entity_type = :t',
+                    ExpressionAttributeValues={':t': {'S': 'district'}},
+                    ProjectionExpression='district_id, #n',
+                    ExpressionAttributeNames={'#n': 'name'},
+                    Segment=segment,
+                    TotalSegments=SCAN_SEGMENTS
+                ))
+
+            with ThreadPoolExecutor(max_workers=SCAN_SEGMENTS) as executor:
+                for pages in executor.map(scan_segment, range(SCAN_SEGMENTS)):
+                    add_districts(pages)
+
         print(f"✓ Found {len(district_map)} districts in table")
 
     except Exception as e:
@@ -59,7 +133,7 @@ def build_district_name_to_id_map(table_name):
     return district_map
 
 def load_salary_json():
-    """Load salary data from JSON file"""
+    """Load salary data from JSON file, yielding one salary record at a time"""
     json_path = Path(__file__).parent.parent.parent / 'data' / 'salary_data.json'
 
     # Try example file if main file doesn't exist
@@ -67,14 +141,94 @@ def load_salary_json():
         json_path = Path(__file__).parent.parent.parent / 'data' / 'salary_data.example.json'
         print(f"Using example data file: {json_path}")
 
+    # Stream records one at a time when ijson is installed so the whole file
+    # is never held in memory as a Python object tree
+    if ijson is not None:
+        with open(json_path, 'rb') as f:
+            yield from ijson.items(f, 'item')
+        return
+
+    # Parse non-integer numbers straight to Decimal (ijson does the same), so
+    # salaries need no float -> str -> Decimal round trip
     with open(json_path, 'r') as f:
-        return json.load(f)
+        yield from json.load(f, parse_float=Decimal)
+
+_NON_ALNUM = re.compile(r'[^a-z0-9 ]+')
+_MIN_TOKEN_LENGTH = 4
+
+# A fuzzy match is accepted only if its similarity (0-100) reaches
+# _FUZZY_MIN_SCORE and beats the runner-up by at least _FUZZY_MIN_MARGIN;
+# anything closer is ambiguous (e.g. "springfield" vs "west springfield")
+_FUZZY_MIN_SCORE = 90
+_FUZZY_MIN_MARGIN = 5
+
 
-def match_district_name_to_id(district_name, district_map):
+@lru_cache(maxsize=None)
+def _canon(name):
+    """
+    Canonical form of a district name for matching: accents folded, casefolded,
+    punctuation replaced by spaces and whitespace collapsed
+    """
+    folded = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode('ascii').casefold()
+    return ' '.join(_NON_ALNUM.sub(' ', folded).split())
+
+
+class DistrictLookup(NamedTuple):
+    """Precomputed indexes over the district name map"""
+    canonical_map: Dict[str, str]  # canonical name -> district_id
+    token_index: Dict[str, Set[str]]  # significant token -> canonical names containing it
+    choices: List[str]  # canonical names, for fuzzy matching
+
+
+def build_district_lookup(district_map):
+    """Precompute lookup structures for match_district_name_to_id"""
+    canonical_map = {}
+    token_index = defaultdict(set)
+
+    for db_name, district_id in district_map.items():
+        key = _canon(db_name)
+        canonical_map[key] = district_id
+        for token in key.split():
+            if len(token) >= _MIN_TOKEN_LENGTH:
+                token_index[token].add(key)
+
+    return DistrictLookup(canonical_map, dict(token_index), list(canonical_map))
+
+
+def _similarity(a, b):
+    """
+    Indel similarity of two strings on a 0-100 scale, 200 * LCS / (len(a) + len(b))
+    Same score as rapidfuzz's fuzz.ratio, used when rapidfuzz is not installed
+    """
+    if not a and not b:
+        return 100.0
+    previous = [0] * (len(b) + 1)
+    for char_a in a:
+        current = [0]
+        for j, char_b in enumerate(b):
+            current.append(previous[j] + 1 if char_a == char_b else max(previous[j + 1], current[j]))
+        previous = current
+    return 200.0 * previous[-1] / (len(a) + len(b))
+
+
+def _top_fuzzy_matches(key, choices):
+    """Return the two most similar canonical names as [(name, score), ...]"""
+    if fuzz_process is not None:
+        # Same scores as _similarity, computed by the C extension
+        matches = fuzz_process.extract(key, choices, scorer=fuzz.ratio, limit=2)
+        return [(name, score) for name, score, _ in matches]
+    return heapq.nlargest(2, ((name, _similarity(key, name)) for name in choices), key=itemgetter(1))
+
+
+def match_district_name_to_id(district_name, district_map, lookup=None):
     """
     Match a district name from salary data to a UUID from the districts table
     Returns: (district_id, matched) where matched is True if found in map
     """
+    if lookup is None:
+        lookup = build_district_lookup(district_map)
+    canonical_map, token_index, choices = lookup
+
     # Normalize the name for matching
     normalized_name = district_name.lower().strip()
 
@@ -82,47 +236,68 @@ def match_district_name_to_id(district_name, district_map):
     if normalized_name in district_map:
         return district_map[normalized_name], True
 
-    # Try fuzzy matching - check if any district name contains this or vice versa
-    for db_name, district_id in district_map.items():
-        if normalized_name in db_name or db_name in normalized_name:
-            return district_id, True
+    # Canonical match (ignores case, accents, punctuation and spacing)
+    key = _canon(district_name)
+    if key in canonical_map:
+        return canonical_map[key], True
+
+    # Token match - accept only if every significant token is indexed, the
+    # tokens identify one district and that district's name contains every
+    # query token (so "Foo Lowell" does not collapse to "lowell")
+    tokens = set(key.split())
+    significant = [t for t in tokens if len(t) >= _MIN_TOKEN_LENGTH]
+    if significant and all(t in token_index for t in significant):
+        candidates = set.intersection(*(token_index[t] for t in significant))
+        if len(candidates) == 1:
+            candidate = candidates.pop()
+            if tokens <= set(candidate.split()):
+                return canonical_map[candidate], True
+
+    # Fuzzy match - accept only a clear winner; a tie or near-tie is ambiguous
+    # (scores are rounded so rapidfuzz and the pure-Python scorer agree)
+    matches = [(name, round(score, 6)) for name, score in _top_fuzzy_matches(key, choices)]
+    if matches and matches[0][1] >= _FUZZY_MIN_SCORE:
+        if len(matches) == 1 or matches[0][1] - matches[1][1] >= _FUZZY_MIN_MARGIN:
+            return canonical_map[matches[0][0]], True
+        print(f"  ⚠️  Ambiguous match for '{district_name}': '{matches[0][0]}' vs '{matches[1][0]}'")
 
     # No match - use the original district_name as fallback
     print(f"  ⚠️  No UUID match for '{district_name}', using name as ID")
     return district_name, False
 
-def pad_number(num, width):
-    """Pad a number with leading zeros"""
-    return str(num).zfill(width)
+# Inverted salaries are subtracted from this 10-digit maximum (~$100M in cents)
+_INVERTED_SALARY_MAX = 9999999999
+_CENTS_PER_DOLLAR = Decimal(100)
+
 
 def pad_salary(salary):
     """
     Pad salary for lexicographic sorting in DynamoDB GSI
     Converts to integer cents and pads to 10 digits (supports up to $9,999,999.99)
     Inverted for descending sort (higher salaries first)
-    """
-    # Convert to cents as integer
-    if isinstance(salary, Decimal):
-        cents = int(salary * 100)
-    else:
-        cents = int(float(salary) * 100)
 
-    # Invert for descending sort: subtract from max value
-    # Max value: 9999999999 (10 digits, ~$100M)
-    inverted = 9999999999 - cents
-
-    return str(inverted).zfill(10)
+    salary must be a Decimal (create_items guarantees this)
+    """
+    return f'{_INVERTED_SALARY_MAX - int(salary * _CENTS_PER_DOLLAR):010d}'
 
 def create_items(salary_records, district_map, table_name):
     """
     Create DynamoDB items for the new single-table design
 
+    Generator: salary items are yielded as records are read, and the metadata
+    items (built from totals tracked along the way) are yielded at the end, so
+    no full list of items is ever held in memory. Malformed records are
+    skipped with a warning rather than aborting a load that has already
+    written earlier rows.
+
     Structure:
     - Main items: district + schedule + salary entry
     - Metadata items: track available year/period combinations
     """
-    items = []
-    match_stats = {'matched': 0, 'unmatched': 0}
+    match_stats = {'matched': 0, 'unmatched': 0, 'skipped': 0}
+
+    # One timestamp for every metadata item written by this run
+    run_timestamp = datetime.now(UTC).isoformat()
 
     # Track all year/period combinations
     year_periods = set()
@@ -130,46 +305,81 @@ def create_items(salary_records, district_map, table_name):
     # Group by district + year + period to track what we're creating
     schedules_created = defaultdict(set)
 
-    # Track availability: year_period -> district_id -> edu+credit -> max_step
-    availability_tracker = defaultdict(lambda: defaultdict(lambda: defaultdict(lambda: {'max_step': 0})))
+    # Track availability: (year, period, district_id, edu+credit) -> max_step
+    availability_max_steps = {}
 
     # Track global maximums for normalization
     global_max_step = 0
     global_edu_credit_combos = set()  # Only track combos that actually exist in data
 
-    for record in salary_records:
-        district_name = record['district_name']
-        district_id, matched = match_district_name_to_id(district_name, district_map)
+    # Bound method used once per record, looked up once
+    add_year_period = year_periods.add
+
+    # Build the name-matching indexes once instead of per record
+    district_lookup = build_district_lookup(district_map)
+
+    # Resolved (district_id, matched) per raw district name; each name is
+    # matched (and any "No UUID match" warning printed) only once per run
+    resolved_districts = {}
+
+    for record_number, record in enumerate(salary_records, start=1):
+        # These fields have only a handful of distinct values across all rows;
+        # interning makes every item share one string object per value
+        try:
+            district_name = sys.intern(record['district_name'])
+            school_year = sys.intern(record['school_year'])
+            period = sys.intern(record['period'])
+            education = sys.intern(record['education'])
+            credits = int(record['credits'])
+            step = int(record['step'])
+            salary = record['salary']
+            if not isinstance(salary, Decimal):
+                # Integers convert exactly; anything else goes through str() to
+                # avoid binary float artifacts
+                salary = Decimal(salary) if isinstance(salary, int) else Decimal(str(salary))
+            if not salary.is_finite():
+                raise ValueError(f"salary is not a number: {salary}")
+        except (KeyError, TypeError, ValueError, InvalidOperation) as e:
+            match_stats['skipped'] += 1
+            if match_stats['skipped'] <= 10:
+                print(f"  ⚠️  Skipping malformed salary record #{record_number}: {e!r}")
+            continue
+
+        resolved = resolved_districts.get(district_name)
+        if resolved is None:
+            resolved = match_district_name_to_id(district_name, district_map, district_lookup)
+            resolved_districts[district_name] = resolved
+        district_id, matched = resolved
 
         if matched:
             match_stats['matched'] += 1
         else:
             match_stats['unmatched'] += 1
 
-        school_year = record['school_year']
-        period = record['period']
-        education = record['education']
-        credits = int(record['credits'])
-        step = int(record['step'])
-        salary = Decimal(str(record['salary']))
 
-        # Pad numbers for proper sorting
-        credits_padded = pad_number(credits, 3)
-        step_padded = pad_number(step, 2)
-        salary_padded = pad_salary(salary)
+        # Key fragments shared by the table and GSI keys below, built once per
+        # record; numbers are zero-padded for proper sorting
+        year_period = (school_year, period)
+        year_period_prefix = f'YEAR#{school_year}#PERIOD#{period}'
+        edu_credits = f'EDU#{education}#CR#{credits:03d}'
+        step_part = f'STEP#{step:02d}'
+        district_part = f'DISTRICT#{district_id}'
+        edu_credits_step = f'{edu_credits}#{step_part}'
+
+        schedule_sk = f'SCHEDULE#{school_year}#{period}#{edu_credits_step}'
 
         # Track this year/period combination
-        year_periods.add((school_year, period))
+        add_year_period(year_period)
 
         # Track schedule created for this district
-        schedules_created[district_id].add((school_year, period))
+        schedules_created[district_id].add(year_period)
 
         # Create main item
         # PK: DISTRICT#<districtId>
         # SK: SCHEDULE#<yyyy>#<period>#EDU#<edu>#CR#<credits>#STEP#<step>
         item = {
-            'PK': f'DISTRICT#{district_id}',
-            'SK': f'SCHEDULE#{school_year}#{period}#EDU#{education}#CR#{credits_padded}#STEP#{step_padded}',
+            'PK': district_part,
+            'SK': schedule_sk,
 
             # Attributes
             'district_id': district_id,
@@ -184,39 +394,42 @@ def create_items(salary_records, district_map, table_name):
             # GSI1: Education/Credits query with step sorting
             # PK: YEAR#<yyyy>#PERIOD#<period>#EDU#<edu>#CR#<credits>
             # SK: STEP#<step>#DISTRICT#<districtId>
-            'GSI1PK': f'YEAR#{school_year}#PERIOD#{period}#EDU#{education}#CR#{credits_padded}',
-            'GSI1SK': f'STEP#{step_padded}#DISTRICT#{district_id}',
+            'GSI1PK': f'{year_period_prefix}#{edu_credits}',
+            'GSI1SK': f'{step_part}#{district_part}',
 
             # GSI2: Fallback query - get all salaries for a district's specific schedule
             # PK: YEAR#<yyyy>#PERIOD#<period>#DISTRICT#<districtId>
             # SK: EDU#<edu>#CR#<credits>#STEP#<step>
-            'GSI2PK': f'YEAR#{school_year}#PERIOD#{period}#DISTRICT#{district_id}',
-            'GSI2SK': f'EDU#{education}#CR#{credits_padded}#STEP#{step_padded}',
+            'GSI2PK': f'{year_period_prefix}#{district_part}',
+            'GSI2SK': edu_credits_step,
 
             # GSI5: Fast comparison queries - single query for all districts (Option 2 optimization)
             # PK: EDU#<edu>#CR#<credits>#STEP#<step>
             # SK: SALARY#<salary_padded>#YEAR#<yyyy>#DISTRICT#<districtId>
-            'GSI_COMP_PK': f'EDU#{education}#CR#{credits_padded}#STEP#{step_padded}',
-            'GSI_COMP_SK': f'SALARY#{salary_padded}#YEAR#{school_year}#DISTRICT#{district_id}',
+            'GSI_COMP_PK': edu_credits_step,
+            'GSI_COMP_SK': f'SALARY#{pad_salary(salary)}#YEAR#{school_year}#{district_part}',
         }
 
-        items.append(item)
+        yield item
 
         # Track availability for this year/period/district/edu+credit combo
-        year_period_key = (school_year, period)
         edu_credit_key = f'{education}+{credits}'
 
         # Update max step for this combo
-        current_max = availability_tracker[year_period_key][district_id][edu_credit_key]['max_step']
-        availability_tracker[year_period_key][district_id][edu_credit_key]['max_step'] = max(current_max, step)
+        availability_key = (school_year, period, district_id, edu_credit_key)
+        if step > availability_max_steps.get(availability_key, -1):
+            availability_max_steps[availability_key] = step
 
         # Track global maximums
         global_max_step = max(global_max_step, step)
         global_edu_credit_combos.add(edu_credit_key)
 
+    print(f"  ✓ Loaded {match_stats['matched'] + match_stats['unmatched']} salary records")
     print(f"  ✓ Matched {match_stats['matched']} salary records to district UUIDs")
     if match_stats['unmatched'] > 0:
         print(f"  ⚠️  {match_stats['unmatched']} records not matched (using name as ID)")
+    if match_stats['skipped'] > 0:
+        print(f"  ⚠️  {match_stats['skipped']} malformed records skipped")
 
     # Create metadata items for year/period tracking
     metadata_items = []
@@ -226,22 +439,27 @@ def create_items(salary_records, district_map, table_name):
             'SK': f'YEAR#{school_year}#PERIOD#{period}',
             'school_year': school_year,
             'period': period,
-            'created_at': datetime.now(UTC).isoformat()
+            'created_at': run_timestamp
         }
         metadata_items.append(metadata_item)
 
     print(f"  ✓ Created {len(metadata_items)} metadata items for year/period combinations")
     print(f"  ✓ Created schedules for {len(schedules_created)} districts")
 
+    yield from metadata_items
+
+    # Group max steps by year/period -> district_id -> edu+credit
+    availability_by_year_period = defaultdict(lambda: defaultdict(dict))
+    for (school_year, period, district_id, edu_credit_key), max_step in availability_max_steps.items():
+        availability_by_year_period[(school_year, period)][district_id][edu_credit_key] = {'max_step': max_step}
+
     # Create availability index metadata items
     availability_items = []
-    for year_period_key, districts_data in availability_tracker.items():
+    for year_period_key, districts_data in availability_by_year_period.items():
         school_year, period = year_period_key
 
         # Convert nested dict to simpler structure for DynamoDB
-        districts_availability = {}
-        for district_id, edu_credits in districts_data.items():
-            districts_availability[district_id] = dict(edu_credits)
+        districts_availability = dict(districts_data)
 
         availability_item = {
             'PK': 'METADATA#AVAILABILITY',
@@ -249,61 +467,139 @@ def create_items(salary_records, district_map, table_name):
             'school_year': school_year,
             'period': period,
             'districts': districts_availability,
-            'created_at': datetime.now(UTC).isoformat()
+            'num_districts': len(districts_availability),
+            'created_at': run_timestamp
         }
         availability_items.append(availability_item)
 
     print(f"  ✓ Created {len(availability_items)} availability index items")
 
+    yield from availability_items
+
     # Create max values metadata item for normalization
     max_values_item = {
         'PK': 'METADATA#MAXVALUES',
         'SK': 'GLOBAL',
         'max_step': global_max_step,
         'edu_credit_combos': sorted(list(global_edu_credit_combos)),  # Only combos that exist in data
-        'last_updated': datetime.now(UTC).isoformat()
+        'last_updated': run_timestamp
     }
 
     print(f"  ✓ Created max values metadata:")
     print(f"    max_step: {global_max_step}")
     print(f"    edu_credit_combos: {len(global_edu_credit_combos)} combinations")
 
-    return items + metadata_items + availability_items + [max_values_item]
+    yield max_values_item
 
-def batch_write_items(table_name, items, description):
-    """Write items to DynamoDB in batches"""
-    table = dynamodb.Table(table_name)
+def _write_one_batch(client, table_name, batch):
+    """
+    Write up to 25 items with one BatchWriteItem call, retrying unprocessed
+    items with exponential backoff
+    Returns: number of items written
+    """
+    requests = [
+        {'PutRequest': {'Item': {k: _serializer.serialize(v) for k, v in item.items()}}}
+        for item in batch
+    ]
 
-    print(f"\nWriting {len(items)} items to {table_name}...")
+    for attempt in range(MAX_WRITE_RETRIES):
+        response = client.batch_write_item(RequestItems={table_name: requests})
+        requests = response.get('UnprocessedItems', {}).get(table_name, [])
+        if not requests:
+            return len(batch)
+        time.sleep(2 ** attempt * 0.05 + random.random() * 0.05)
 
-    batch_size = 25
-    written = 0
-    failed = 0
+    raise RuntimeError(f"{len(requests)} items still unprocessed after {MAX_WRITE_RETRIES} attempts")
 
-    for i in range(0, len(items), batch_size):
-        batch = items[i:i + batch_size]
 
-        try:
-            with table.batch_writer() as writer:
-                for item in batch:
-                    writer.put_item(Item=item)
+def batch_write_items(table_name, items, description):
+    """
+    Write items to DynamoDB in batches of 25, several batches in parallel
+
+    items may be any iterable (e.g. the create_items generator); batches are
+    sliced off it as workers free up, so only a bounded number of batches is
+    held in memory at a time. If reading from items raises, no further batches
+    are started; batches already in flight finish, the counts are printed and
+    the error is re-raised.
+    """
+    # Low-level clients are thread-safe, so all workers share one
+    client = dynamodb_client
 
-            written += len(batch)
-            print(f"  Progress: {written}/{len(items)} items written")
+    print(f"\nWriting items to {table_name}...")
 
-        except Exception as e:
-            print(f"  ✗ Error writing batch: {e}")
-            failed += len(batch)
+    batch_size = 25
+    max_in_flight = WRITE_WORKERS * 2
+    written = 0
+    failed = 0
+    duplicates = 0
+    # Progress is printed at most once per second rather than per batch
+    last_progress = time.monotonic()
+
+    def collect(done):
+        nonlocal written, failed, last_progress
+        for future in done:
+            batch_len = len(pending.pop(future))
+            try:
+                written += future.result()
+            except Exception as e:
+                print(f"  ✗ Error writing batch: {e}")
+                failed += batch_len
+
+        now = time.monotonic()
+        if now - last_progress >= 1.0:
+            print(f"  Progress: {written} items written")
+            last_progress = now
+
+    items_iter = iter(items)
+    pending = {}
+    read_error = None
+    with ThreadPoolExecutor(max_workers=WRITE_WORKERS) as executor:
+        while True:
+            try:
+                batch = list(itertools.islice(items_iter, batch_size))
+            except Exception as e:
+                # Items sliced into the failed batch are lost with it; stop
+                # here and let the batches already submitted finish
+                read_error = e
+                break
+            if not batch:
+                break
+
+            # Rows repeating a PK/SK (e.g. re-scraped data) would make
+            # DynamoDB reject the whole request, so keep only the last row per
+            # key within the batch - the same row a sequential put would leave
+            by_key = {(item['PK'], item['SK']): item for item in batch}
+            duplicates += len(batch) - len(by_key)
+            batch = list(by_key.values())
+            batch_keys = set(by_key)
+
+            # A key repeated in a later batch must not race an earlier batch
+            # still in flight, or the older row could win
+            conflicting = [f for f, keys in pending.items() if not keys.isdisjoint(batch_keys)]
+            if conflicting:
+                wait(conflicting)
+                collect(conflicting)
+
+            pending[executor.submit(_write_one_batch, client, table_name, batch)] = batch_keys
+
+            if len(pending) >= max_in_flight:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+
+        collect(list(pending))
 
     print(f"\n✓ {description} complete:")
     print(f"    Written: {written}")
     print(f"    Failed: {failed}")
+    if duplicates > 0:
+        print(f"    Duplicate rows replaced by a later row with the same key: {duplicates}")
+    if read_error is not None:
+        print(f"  ✗ Stopped early, could not read further items: {read_error}")
+        raise read_error
 
     return written, failed
 
 def main():
-    import sys
-    import os
     from dotenv import load_dotenv
 
     # Load environment variables from /backend/.env file
@@ -333,26 +629,29 @@ def main():
     # Build district name to UUID mapping
     district_map = build_district_name_to_id_map(table_name)
 
-    # Load data
-    print("\nLoading salary data from JSON...")
+    # Load data (streamed); items are created lazily as they are written
+    print("\nLoading salary data from JSON and creating DynamoDB items...")
     salary_records = load_salary_json()
-    print(f"✓ Loaded {len(salary_records)} salary records")
-
-    # Create items
-    print("\nCreating DynamoDB items...")
     items = create_items(salary_records, district_map, table_name)
-    print(f"✓ Created {len(items)} total items (salary entries + metadata)")
 
     # Write to DynamoDB
     print(f"\n{'='*80}")
     print("Writing to DynamoDB...")
     print(f"{'='*80}")
 
-    written, failed = batch_write_items(
-        table_name,
-        items,
-        "Salary data import"
-    )
+    try:
+        written, failed = batch_write_items(
+            table_name,
+            items,
+            "Salary data import"
+        )
+    except Exception as e:
+        # The salary rows written so far stay in the table, but the metadata
+        # items come last and were never written
+        print(f"\n✗ Import stopped: {e}")
+        print("    Metadata items (schedules, availability, max values) were not written")
+        print("    Fix the data file and re-run; normalization was skipped\n")
+        sys.exit(1)
 
     # Summary
     print(f"\n{'='*80}")
@@ -370,7 +669,6 @@ def main():
         print(f"{'='*80}\n")
 
         import subprocess
-        import os
 
         # Get the directory where this script is located
         script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -16,6 +16,7 @@ Usage:
   OR set environment variables in backend/.env:
     DYNAMODB_TABLE_NAME=<table>
     AWS_REGION=<region>
+    NORMALIZE_SCAN_SEGMENTS=<n>  (parallel scan segments, default 8)
 
 Options:
   --dry-run    Show what would be updated without making changes
@@ -25,6 +26,8 @@ import os
 import sys
 import argparse
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from decimal import Decimal
 
@@ -37,31 +40,31 @@ logger.setLevel(logging.INFO)
 logging.basicConfig(format='%(levelname)s: %(message)s')
 
 
-def should_normalize_period(period_value):
-    """Check if a period value needs normalization to 'Full Year'"""
-    if not period_value:
-        return False
-
-    # Already correct
-    if period_value == 'Full Year':
-        return False
+CANONICAL_PERIOD = 'Full Year'
 
-    # Common variations that should be normalized
-    normalized = period_value.lower().replace('-', ' ').replace('_', ' ').strip()
+# Lowercased spellings of "full year" (after mapping '-' and '_' to spaces)
+# that should be rewritten to CANONICAL_PERIOD
+FULL_YEAR_VARIANTS = frozenset({'full year', 'fullyear', 'fy'})
+_DASH_UNDERSCORE_TO_SPACE = str.maketrans('-_', '  ')
 
-    # Check if it's a variation of "full year"
-    if normalized == 'full year':
-        return True
 
-    # Check for other common full-year abbreviations
-    if period_value.upper() in ['FY', 'FULL_YEAR', 'FULLYEAR']:
-        return True
+@lru_cache(maxsize=4096)
+def should_normalize_period(period_value):
+    """Check if a period value needs normalization to 'Full Year'"""
+    # Only a handful of distinct period strings exist, so results are cached
+    if not period_value or period_value == CANONICAL_PERIOD:
+        return False
 
-    return False
+    normalized = period_value.lower().translate(_DASH_UNDERSCORE_TO_SPACE).strip()
+    return normalized in FULL_YEAR_VARIANTS
 
 
 def update_schedule_item_period(table, item, dry_run=False):
-    """Update a salary schedule item's period value and all related keys"""
+    """
+    Update a salary schedule item's period value and all related keys
+
+    table may be a batch writer; only delete_item and put_item are used.
+    """
     old_period = item.get('period', '')
 
     if not should_normalize_period(old_period):
@@ -97,8 +100,10 @@ def update_schedule_item_period(table, item, dry_run=False):
         new_item['GSI2PK'] = new_item['GSI2PK'].replace(f'PERIOD#{old_period}', f'PERIOD#{new_period}')
         logger.info(f"    Updated GSI2PK")
 
-    # Delete old item
-    table.delete_item(Key={'PK': item['PK'], 'SK': item['SK']})
+    # Delete old item, unless the key is unchanged and the put overwrites it
+    # (a retried delete could otherwise land after the put)
+    if new_item['SK'] != item['SK']:
+        table.delete_item(Key={'PK': item['PK'], 'SK': item['SK']})
 
     # Put new item
     table.put_item(Item=new_item)
@@ -107,7 +112,11 @@ def update_schedule_item_period(table, item, dry_run=False):
 
 
 def update_metadata_schedules_item(table, item, dry_run=False):
-    """Update a METADATA#SCHEDULES item's period value"""
+    """
+    Update a METADATA#SCHEDULES item's period value
+
+    table may be a batch writer; only delete_item and put_item are used.
+    """
     old_period = item.get('period', '')
 
     if not should_normalize_period(old_period):
@@ -130,8 +139,9 @@ def update_metadata_schedules_item(table, item, dry_run=False):
         new_item['SK'] = new_item['SK'].replace(f'PERIOD#{old_period}', f'PERIOD#{new_period}')
         logger.info(f"    Updated SK: {item['SK']} -> {new_item['SK']}")
 
-    # Delete old item and create new one
-    table.delete_item(Key={'PK': item['PK'], 'SK': item['SK']})
+    # Delete old item and create new one (a put alone when the key is unchanged)
+    if new_item['SK'] != item['SK']:
+        table.delete_item(Key={'PK': item['PK'], 'SK': item['SK']})
     table.put_item(Item=new_item)
 
     return True
@@ -203,6 +213,7 @@ def update_availability_metadata_item(table, item, dry_run=False):
 
             # Update the existing target with merged districts
             existing_item['districts'] = merged_districts
+            existing_item['num_districts'] = len(merged_districts)
             existing_item['period'] = new_period
             table.put_item(Item=existing_item)
         else:
@@ -216,6 +227,41 @@ def update_availability_metadata_item(table, item, dry_run=False):
     return True
 
 
+# Number of parallel segments used to scan the table
+SCAN_SEGMENTS = int(os.environ.get('NORMALIZE_SCAN_SEGMENTS', '8'))
+
+
+def _scan_segment(table_name, aws_region, segment, total_segments):
+    """Scan one segment of the table and return its items"""
+    # Resources are not thread-safe, so each worker builds its own
+    table = boto3.session.Session().resource('dynamodb', region_name=aws_region).Table(table_name)
+
+    items = []
+    scan_kwargs = {'Segment': segment, 'TotalSegments': total_segments}
+    while True:
+        response = table.scan(**scan_kwargs)
+        items.extend(response.get('Items', []))
+        if 'LastEvaluatedKey' not in response:
+            return items
+        scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+
+def parallel_scan(table_name, aws_region, total_segments=SCAN_SEGMENTS):
+    """
+    Scan the whole table with total_segments concurrent segment scans
+
+    Yields each segment's items as that segment finishes, so callers can start
+    processing before the slowest segment is done.
+    """
+    with ThreadPoolExecutor(max_workers=total_segments) as executor:
+        futures = [
+            executor.submit(_scan_segment, table_name, aws_region, segment, total_segments)
+            for segment in range(total_segments)
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
 def scan_and_update(table, table_name, aws_region, dry_run=False):
     """Scan the entire table and update period values"""
     logger.info(f"{'[DRY RUN] ' if dry_run else ''}Starting period normalization...")
@@ -228,42 +274,44 @@ def scan_and_update(table, table_name, aws_region, dry_run=False):
     metadata_items_updated = 0
     availability_items_updated = 0
 
-    # Scan the entire table
-    scan_kwargs = {}
-
-    while True:
-        response = table.scan(**scan_kwargs)
-        items = response.get('Items', [])
-        total_scanned += len(items)
-
-        for item in items:
-            pk = item.get('PK', '')
-            sk = item.get('SK', '')
-
-            # Handle salary schedule items (DISTRICT# / SCHEDULE#...)
-            if pk.startswith('DISTRICT#') and sk.startswith('SCHEDULE#'):
-                if update_schedule_item_period(table, item, dry_run):
-                    total_updated += 1
-                    schedule_items_updated += 1
-
-            # Handle METADATA#SCHEDULES items
-            elif pk == 'METADATA#SCHEDULES' and sk.startswith('YEAR#'):
-                if update_metadata_schedules_item(table, item, dry_run):
-                    total_updated += 1
-                    metadata_items_updated += 1
-
-            # Handle METADATA#AVAILABILITY items
-            elif pk == 'METADATA#AVAILABILITY' and 'PERIOD#' in sk:
-                if update_availability_metadata_item(table, item, dry_run):
-                    total_updated += 1
-                    availability_items_updated += 1
-
-        # Check for pagination
-        if 'LastEvaluatedKey' not in response:
-            break
-
-        scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
-        logger.info(f"Scanned {total_scanned} items so far, updated {total_updated}...")
+    # Scan the entire table in parallel segments. Updates are applied here in
+    # the calling thread, so availability merges never race each other.
+    #
+    # Schedule and METADATA#SCHEDULES rekeys (delete old key + put new key) go
+    # through a batch writer, which sends them 25 at a time and flushes the
+    # remainder when the block exits. The old key is only deleted when it
+    # differs from the new one, since the writer may resend a throttled delete
+    # after a later put; overwrite_by_pkeys keeps two puts of the same new key
+    # out of one request.
+    # Availability items read their merge target first, so they are written
+    # directly.
+    with table.batch_writer(overwrite_by_pkeys=['PK', 'SK']) as writer:
+        for items in parallel_scan(table_name, aws_region):
+            total_scanned += len(items)
+
+            for item in items:
+                pk = item.get('PK', '')
+                sk = item.get('SK', '')
+
+                # Handle salary schedule items (DISTRICT# / SCHEDULE#...)
+                if pk.startswith('DISTRICT#') and sk.startswith('SCHEDULE#'):
+                    if update_schedule_item_period(writer, item, dry_run):
+                        total_updated += 1
+                        schedule_items_updated += 1
+
+                # Handle METADATA#SCHEDULES items
+                elif pk == 'METADATA#SCHEDULES' and sk.startswith('YEAR#'):
+                    if update_metadata_schedules_item(writer, item, dry_run):
+                        total_updated += 1
+                        metadata_items_updated += 1
+
+                # Handle METADATA#AVAILABILITY items
+                elif pk == 'METADATA#AVAILABILITY' and 'PERIOD#' in sk:
+                    if update_availability_metadata_item(table, item, dry_run):
+                        total_updated += 1
+                        availability_items_updated += 1
+
+            logger.info(f"Scanned {total_scanned} items so far, updated {total_updated}...")
 
     logger.info(f"\n{'[DRY RUN] ' if dry_run else ''}Scan complete!")
     logger.info(f"Total items scanned: {total_scanned}")
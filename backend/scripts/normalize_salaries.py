@@ -5,30 +5,57 @@ as the Lambda normalizer (backend/utils/normalization.py).
 
 Usage:
   DYNAMODB_TABLE_NAME=<table> AWS_REGION=<region> python backend/scripts/normalize_salaries.py
+
+  NORMALIZE_WRITE_WORKERS=<n> sets how many batches are written in parallel (default 8)
+  NORMALIZE_QUERY_WORKERS=<n> sets how many districts are queried in parallel (default 16)
 """
 
 import os
 import sys
+import time
+import random
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, UTC
 from decimal import Decimal
 from pathlib import Path
 
 import boto3
 from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from botocore.exceptions import ClientError
 
 # Make backend importable
 backend_path = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_path))
 
 from utils.normalization import generate_calculated_entries
-from database import table, AWS_REGION, TABLE_NAME
+from database import table, dynamodb_client, AWS_REGION, TABLE_NAME
 
 # Configure logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 logging.basicConfig(format='%(levelname)s: %(message)s')
 
+# Number of 25-item batches written concurrently
+WRITE_WORKERS = int(os.environ.get('NORMALIZE_WRITE_WORKERS', '8'))
+MAX_WRITE_RETRIES = 5
+
+# Error codes DynamoDB uses for throttling; batches hitting these are retried
+RETRYABLE_WRITE_ERRORS = frozenset({
+    'ProvisionedThroughputExceededException',
+    'ThrottlingException',
+    'RequestLimitExceeded',
+})
+
+# Number of per-district queries run concurrently
+QUERY_WORKERS = int(os.environ.get('NORMALIZE_QUERY_WORKERS', '16'))
+
+# Batches are written with the low-level client: items are serialized once
+# with a shared TypeSerializer instead of through the resource layer
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
 
 def get_max_values():
     """Get global max values from metadata"""
@@ -45,6 +72,33 @@ def get_all_year_periods():
     return [(item['school_year'], item['period']) for item in resp.get('Items', [])]
 
 
+def _get_real_entries_for_district(year, period, district_id):
+    """Get all real (non-calculated) salary entries for one district"""
+    # Low-level client: it is thread-safe, unlike the table resource
+    paginator = dynamodb_client.get_paginator('query')
+    pages = paginator.paginate(
+        TableName=TABLE_NAME,
+        IndexName='FallbackQueryIndex',
+        KeyConditionExpression='GSI2PK = :pk',
+        # Only real entries (not calculated) are returned, so calculated ones
+        # are never sent over the wire
+        FilterExpression='attribute_not_exists(is_calculated) OR is_calculated <> :calculated',
+        # Only the attributes generate_calculated_entries reads
+        ProjectionExpression='district_name, education, credits, #s, salary',
+        ExpressionAttributeNames={'#s': 'step'},  # 'step' is a reserved word
+        ExpressionAttributeValues={
+            ':pk': {'S': f'YEAR#{year}#PERIOD#{period}#DISTRICT#{district_id}'},
+            ':calculated': {'BOOL': True}
+        }
+    )
+    
+    return [
+        {key: _deserializer.deserialize(value) for key, value in item.items()}
+        for page in pages
+        for item in page.get('Items', [])
+    ]
+
+
 def get_district_data_for_year_period(year, period):
     """Get all real (non-calculated) salary entries for a specific year/period"""
     # Get availability metadata
@@ -55,26 +109,18 @@ def get_district_data_for_year_period(year, period):
     if 'Item' not in resp:
         return {}
     
-    districts = resp['Item'].get('districts', {})
+    district_ids = list(resp['Item'].get('districts', {}).keys())
     district_data = {}
     
-    # Query real entries for each district
-    for district_id in districts.keys():
-        query_resp = table.query(
-            IndexName='FallbackQueryIndex',
-            KeyConditionExpression=Key('GSI2PK').eq(
-                f'YEAR#{year}#PERIOD#{period}#DISTRICT#{district_id}'
-            )
+    # Query each district's entries concurrently
+    with ThreadPoolExecutor(max_workers=QUERY_WORKERS) as executor:
+        results = executor.map(
+            lambda district_id: _get_real_entries_for_district(year, period, district_id),
+            district_ids
         )
-        
-        # Filter to only real entries (not calculated)
-        real_entries = [
-            item for item in query_resp.get('Items', [])
-            if not item.get('is_calculated', False)
-        ]
-        
-        if real_entries:
-            district_data[district_id] = real_entries
+        for district_id, real_entries in zip(district_ids, results):
+            if real_entries:
+                district_data[district_id] = real_entries
     
     return district_data
 
@@ -86,20 +132,51 @@ def ensure_decimal_salary(item):
             item['salary'] = Decimal(str(item['salary']))
 
 
+def _write_one_batch(batch):
+    """
+    Write up to 25 items with one BatchWriteItem call, retrying unprocessed
+    items (and throttled requests) with exponential backoff
+    Returns: number of items written
+    """
+    requests = [
+        {'PutRequest': {'Item': {k: _serializer.serialize(v) for k, v in item.items()}}}
+        for item in batch
+    ]
+
+    for attempt in range(MAX_WRITE_RETRIES):
+        try:
+            response = dynamodb_client.batch_write_item(RequestItems={TABLE_NAME: requests})
+            requests = response.get('UnprocessedItems', {}).get(TABLE_NAME, [])
+            if not requests:
+                return len(batch)
+        except ClientError as e:
+            if e.response['Error']['Code'] not in RETRYABLE_WRITE_ERRORS:
+                raise
+        time.sleep(2 ** attempt * 0.05 + random.random() * 0.05)
+
+    raise RuntimeError(f'{len(requests)} items still unprocessed after {MAX_WRITE_RETRIES} attempts')
+
+
 def batch_write_items(items, description):
-    """Write items to DynamoDB in batches of 25"""
+    """Write items to DynamoDB in batches of 25, several batches at a time"""
     if not items:
         return
     
     logger.info(f'Writing {len(items)} items for {description}...')
     
+    for item in items:
+        ensure_decimal_salary(item)
+    
     batch_size = 25
-    for i in range(0, len(items), batch_size):
-        batch = items[i:i + batch_size]
-        with table.batch_writer() as writer:
-            for item in batch:
-                ensure_decimal_salary(item)
-                writer.put_item(Item=item)
+    batches = [items[i:i + batch_size] for i in range(0, len(items), batch_size)]
+    written = 0
+    
+    with ThreadPoolExecutor(max_workers=WRITE_WORKERS) as executor:
+        futures = [executor.submit(_write_one_batch, batch) for batch in batches]
+        for future in as_completed(futures):
+            written += future.result()
+    
+    logger.info(f'  Wrote {written} items for {description}')
 
 
 def update_global_metadata(max_step, combos):
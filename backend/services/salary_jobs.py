@@ -683,6 +683,7 @@ class SalaryJobsService:
                 districts[district_id] = {combo: True for combo in edu_credits}
 
                 item['districts'] = districts
+                item['num_districts'] = len(districts)
                 item['last_updated'] = datetime.now(UTC).isoformat()
             else:
                 # Create new availability metadata
@@ -694,6 +695,7 @@ class SalaryJobsService:
                     'districts': {
                         district_id: {combo: True for combo in edu_credits}
                     },
+                    'num_districts': 1,
                     'created_at': datetime.now(UTC).isoformat()
                 }
 
@@ -6,27 +6,83 @@ import os
 import time
 from typing import Dict, Any, Optional, List
 from decimal import Decimal
+from functools import lru_cache
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 
 import boto3
 from boto3.dynamodb.conditions import Key, Attr
+from boto3.dynamodb.types import TypeDeserializer
 
 from config import (
     VALID_EDUCATION_LEVELS,
     MIN_STEP,
+    DYNAMODB_CLIENT_CONFIG,
     get_max_step,
     get_valid_credits
 )
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)
+# Per-request query details log at DEBUG; set LOG_LEVEL=DEBUG to see them or
+# WARNING to drop the one INFO summary line per comparison as well. An unknown
+# level name falls back to INFO rather than failing the import
+logger.setLevel(logging.getLevelNamesMapping().get(os.getenv('LOG_LEVEL', 'INFO').upper(), logging.INFO))
+
+# Low-level DynamoDB client for district metadata batch reads when the table
+# does not expose its own. It is reused across warm invocations so pooled
+# keep-alive connections are not rebuilt. Unlike resources, clients are safe
+# to share between threads.
+_dynamodb_client = None
+
+
+def _get_dynamodb_client():
+    """Return the shared low-level DynamoDB client, creating it on first use"""
+    global _dynamodb_client
+    if _dynamodb_client is None:
+        _dynamodb_client = boto3.client(
+            'dynamodb',
+            region_name=os.getenv('AWS_REGION', 'us-east-1'),
+            config=DYNAMODB_CLIENT_CONFIG
+        )
+    return _dynamodb_client
 
 
 # OPTIMIZATION 1: Cache for salary schedules (in-memory, Lambda-scoped)
-# This cache persists across Lambda invocations in the same container
+# This cache persists across Lambda invocations in the same container. It is
+# per-container only, so entries can be stale for at most the TTL after an
+# upload handled by a different container. SALARY_CACHE_TTL=0 disables it.
 _salary_cache = {}
 _cache_ttl_seconds = int(os.getenv('SALARY_CACHE_TTL', '60'))  # 1 minute TTL by default
-_cache_enabled = os.getenv('DISABLE_SALARY_CACHE', '').lower() != 'true'
+_cache_max_entries = int(os.getenv('SALARY_CACHE_MAX_ENTRIES', '4096'))
+_cache_enabled = (
+    os.getenv('DISABLE_SALARY_CACHE', '').lower() != 'true'
+    and _cache_ttl_seconds > 0
+)
+
+# Education levels ranked lowest to highest, used when picking a fallback combo
+_EDU_ORDER = {'B': 1, 'M': 2, 'D': 3}
+
+# Shared worker pool for the comparison path's concurrent DynamoDB reads. It is
+# created once per container so warm invocations do not pay thread start-up.
+# Only low-level client calls run on it: boto3 resources (and their Table
+# objects) are not thread-safe, so resource-based reads stay on the caller.
+_executor = ThreadPoolExecutor(max_workers=16)
+
+# Default type info for districts whose metadata row could not be read
+_UNKNOWN_DISTRICT_INFO = {'district_type': 'unknown', 'contract_pdf': None}
+
+# Item attributes copied into each comparison ranking, in unpacking order
+_RANKING_FIELDS = (
+    'district_id', 'district_name', 'school_year', 'period', 'education',
+    'credits', 'step', 'is_calculated', 'is_calculated_from'
+)
+
+# Attributes read from ComparisonIndex items when building comparison rankings
+_COMPARE_PROJECTION = (
+    'district_id,district_name,school_year,period,education,credits,#s,salary,'
+    'is_calculated,is_calculated_from'
+)
 
 # Module-level table placeholder for tests and callers that set `services.salary_service.table`
 # Tests monkeypatch this attribute; provide a default to allow setattr without errors.
@@ -60,13 +116,12 @@ def get_salary_schedule_for_district_optimized(
     if not table:
         raise Exception('DynamoDB table not configured')
 
-    # OPTIMIZATION 1: Check cache
+    # OPTIMIZATION 1: Check cache (TTL + LRU bounded, honours DISABLE_SALARY_CACHE)
     cache_key = f"{district_id}#{year or 'all'}"
-    if use_cache and cache_key in _salary_cache:
-        cached_data, timestamp = _salary_cache[cache_key]
-        import time
-        if time.time() - timestamp < _cache_ttl_seconds:
-            logger.info(f"Cache hit for {cache_key}")
+    if use_cache:
+        cached_data = _get_cached(cache_key)
+        if cached_data is not None:
+            logger.debug("Cache hit for %s", cache_key)
             return cached_data
 
     # Build key condition
@@ -79,14 +134,13 @@ def get_salary_schedule_for_district_optimized(
 
     # OPTIMIZATION 2: Use ProjectionExpression to reduce data transfer
     # Only fetch fields we actually need
-    response = table.query(
+    items = _query_all(
+        table,
         KeyConditionExpression=key_condition,
         ProjectionExpression='school_year,period,education,credits,#s,salary,is_calculated,is_calculated_from',
         ExpressionAttributeNames={'#s': 'step'}  # 'step' is a reserved word
     )
 
-    items = response.get('Items', [])
-
     if not items:
         return []
 
@@ -125,9 +179,8 @@ def get_salary_schedule_for_district_optimized(
 
     # OPTIMIZATION 6: Cache the result
     if use_cache:
-        import time
-        _salary_cache[cache_key] = (result, time.time())
-        logger.info(f"Cached result for {cache_key}, total items: {len(items)}")
+        _set_cached(cache_key, result)
+        logger.debug("Cached result for %s, total items: %s", cache_key, len(items))
 
     return result
 
@@ -363,6 +416,220 @@ def get_global_salary_metadata(table) -> Dict[str, Any]:
     }
 
 
+def _query_all(table, **query_kwargs) -> List[Dict[str, Any]]:
+    """Run a query and follow LastEvaluatedKey until every page has been read"""
+    response = table.query(**query_kwargs)
+    items = response.get('Items', [])
+    while 'LastEvaluatedKey' in response:
+        response = table.query(**query_kwargs, ExclusiveStartKey=response['LastEvaluatedKey'])
+        items.extend(response.get('Items', []))
+    return items
+
+
+def _get_cached(cache_key: str) -> Optional[Any]:
+    """Return a cached value if caching is enabled and the entry has not expired"""
+    if not _cache_enabled:
+        return None
+
+    entry = _salary_cache.get(cache_key)
+    if entry is None:
+        return None
+
+    cached_data, timestamp = entry
+    if time.time() - timestamp < _cache_ttl_seconds:
+        # Move to the end so eviction drops the least recently used entry
+        _salary_cache[cache_key] = _salary_cache.pop(cache_key, entry)
+        return cached_data
+
+    _salary_cache.pop(cache_key, None)
+    return None
+
+
+def _set_cached(cache_key: str, data: Any) -> None:
+    """Store a value in the module-level cache, evicting the oldest entry when full"""
+    if not _cache_enabled:
+        return
+
+    _salary_cache.pop(cache_key, None)
+    while _salary_cache and len(_salary_cache) >= _cache_max_entries:
+        _salary_cache.pop(next(iter(_salary_cache)), None)
+    _salary_cache[cache_key] = (data, time.time())
+
+
+def _get_schedule_year_periods(table) -> List[tuple]:
+    """
+    Get all (school_year, period) combinations from METADATA#SCHEDULES
+
+    The list only changes when salary data is uploaded, so it is cached under
+    a "compare#" key and cleared by invalidate_comparison_cache().
+    """
+    cache_key = 'compare#meta#schedules'
+    year_periods = _get_cached(cache_key)
+    if year_periods is not None:
+        return year_periods
+
+    metadata_items = _query_all(
+        table,
+        KeyConditionExpression=Key('PK').eq('METADATA#SCHEDULES'),
+        ProjectionExpression='school_year,period'
+    )
+    year_periods = [
+        (item.get('school_year'), item.get('period'))
+        for item in metadata_items
+    ]
+
+    _set_cached(cache_key, year_periods)
+    return year_periods
+
+
+def _get_max_values_item(table) -> Dict[str, Any]:
+    """Get the METADATA#MAXVALUES item, cached like the schedule metadata"""
+    cache_key = 'compare#meta#maxvalues'
+    max_values = _get_cached(cache_key)
+    if max_values is not None:
+        return max_values
+
+    max_values_response = table.get_item(
+        Key={'PK': 'METADATA#MAXVALUES', 'SK': 'GLOBAL'}
+    )
+
+    if 'Item' not in max_values_response:
+        raise Exception('METADATA#MAXVALUES not found. Run load_salary_data.py first.')
+
+    max_values = max_values_response['Item']
+    _set_cached(cache_key, max_values)
+    return max_values
+
+
+class _FloatDeserializer(TypeDeserializer):
+    """TypeDeserializer that returns DynamoDB numbers as float instead of Decimal"""
+
+    def _deserialize_n(self, value):
+        return float(value)
+
+
+_float_deserializer = _FloatDeserializer()
+
+
+def _deserialize_item(raw_item: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a low-level client item into plain Python values"""
+    return {key: _float_deserializer.deserialize(value) for key, value in raw_item.items()}
+
+
+@lru_cache(maxsize=1024)
+def _comparison_partition_key(education: str, credits: int, step: int) -> str:
+    """Build the padded GSI_COMP_PK value for an education/credits/step combination"""
+    return f'EDU#{education}#CR#{pad_number(credits, 3)}#STEP#{pad_number(step, 2)}'
+
+
+def _get_comparison_items(table, education: str, credits: int, step: int) -> List[Dict[str, Any]]:
+    """
+    Get every ComparisonIndex row for one education/credits/step partition
+
+    The same few partitions are read by most comparison and heatmap requests,
+    whatever their district type, year or fallback options, so the rows are
+    cached under a "compare#" key and cleared by invalidate_comparison_cache().
+    """
+    cache_key = f'compare#items#{education}#{credits}#{step}'
+    items = _get_cached(cache_key)
+    if items is not None:
+        return items
+
+    partition_key = _comparison_partition_key(education, int(credits), step)
+    query_kwargs = {
+        'IndexName': 'ComparisonIndex',
+        'ProjectionExpression': _COMPARE_PROJECTION,
+        'ExpressionAttributeNames': {'#s': 'step'}
+    }
+
+    # Prefer the table's low-level client so numbers are deserialized straight
+    # to float; the resource layer builds a Decimal per attribute that the
+    # ranking code would only convert again. Tables without a client (tests)
+    # go through the resource API.
+    client = getattr(getattr(table, 'meta', None), 'client', None)
+    if client is not None:
+        query = client.query
+        query_kwargs.update(
+            TableName=table.name,
+            KeyConditionExpression='GSI_COMP_PK = :pk',
+            ExpressionAttributeValues={':pk': {'S': partition_key}}
+        )
+    else:
+        query = table.query
+        query_kwargs['KeyConditionExpression'] = Key('GSI_COMP_PK').eq(partition_key)
+
+    items = []
+    response = query(**query_kwargs)
+    while True:
+        page = response.get('Items', [])
+        if client is not None:
+            page = [_deserialize_item(raw) for raw in page]
+        items.extend(page)
+
+        if 'LastEvaluatedKey' not in response:
+            break
+        response = query(**query_kwargs, ExclusiveStartKey=response['LastEvaluatedKey'])
+
+    _set_cached(cache_key, items)
+    return items
+
+
+@lru_cache(maxsize=256)
+def _parse_edu_credit_combo(combo: str) -> Optional[tuple]:
+    """Split an 'EDU+CREDITS' combo into (education, int credits), or None if malformed"""
+    parts = combo.split('+')
+    if len(parts) != 2:
+        return None
+    try:
+        return parts[0], int(parts[1])
+    except ValueError:
+        return None
+
+
+def _get_district_info(table, district_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Batch read type and contract PDF for each district from its metadata row
+
+    Uses the table's low-level client (or the shared one) with BatchGetItem, at
+    most 100 keys per call. Districts whose row is missing or could not be read
+    are left out, so callers fall back to _UNKNOWN_DISTRICT_INFO.
+    """
+    district_info = {}
+    if not district_ids:
+        return district_info
+
+    tbl_name = getattr(table, 'name', 'TEST_TABLE')
+    client = getattr(getattr(table, 'meta', None), 'client', None) or _get_dynamodb_client()
+    try:
+        for i in range(0, len(district_ids), 100):
+            request_items = {
+                tbl_name: {
+                    'Keys': [
+                        {'PK': {'S': f'DISTRICT#{district_id}'}, 'SK': {'S': 'METADATA'}}
+                        for district_id in district_ids[i:i + 100]
+                    ],
+                    'ProjectionExpression': 'PK,district_type,contract_pdf'
+                }
+            }
+            # Retry keys DynamoDB left unprocessed (throttling) with a short backoff
+            for attempt in range(3):
+                response = client.batch_get_item(RequestItems=request_items)
+                for raw_item in response.get('Responses', {}).get(tbl_name, []):
+                    item = _deserialize_item(raw_item)
+                    district_info[item['PK'][len('DISTRICT#'):]] = {
+                        'district_type': item.get('district_type', 'unknown'),
+                        'contract_pdf': item.get('contract_pdf')
+                    }
+                request_items = response.get('UnprocessedKeys')
+                if not request_items:
+                    break
+                time.sleep(0.05 * 2 ** attempt)
+    except Exception as e:
+        logger.error(f"Error fetching district types: {str(e)}")
+
+    return district_info
+
+
 def compare_salaries_across_districts(
     table,
     education: str,
@@ -389,62 +656,46 @@ def compare_salaries_across_districts(
     # OPTIMIZATION: Check cache first
     cache_key = f"compare#{education}#{credits}#{step}#{district_type or 'all'}#{year_param or 'latest'}#{include_fallback}"
 
-    if _cache_enabled and cache_key in _salary_cache:
-        cached_data, timestamp = _salary_cache[cache_key]
-        if time.time() - timestamp < _cache_ttl_seconds:
-            logger.info(f"Cache HIT for comparison query {cache_key}")
-            return cached_data
-        else:
-            del _salary_cache[cache_key]
-            logger.info(f"Cache EXPIRED for comparison query {cache_key}")
+    cached_data = _get_cached(cache_key)
+    if cached_data is not None:
+        logger.debug("Cache HIT for comparison query %s", cache_key)
+        return cached_data
 
     # Cache miss - proceed with query
     query_start_time = time.time()
-    logger.info(f"Cache MISS for comparison query {cache_key}")
+    logger.debug("Cache MISS for comparison query %s", cache_key)
 
     # STEP 1: Get metadata to get all available year/period combinations
-    metadata_response = table.query(
-        KeyConditionExpression=Key('PK').eq('METADATA#SCHEDULES')
-    )
-    metadata_items = metadata_response.get('Items', [])
+    all_year_periods = _get_schedule_year_periods(table)
 
-    # Get all year/period combinations
     if year_param:
         # Filter to only the specified year
         year_periods = [
-            (item.get('school_year'), item.get('period'))
-            for item in metadata_items
-            if item.get('school_year') == year_param
+            (school_year, period)
+            for school_year, period in all_year_periods
+            if school_year == year_param
         ]
         if not year_periods:
             raise ValueError(f'No data found for year {year_param}')
     else:
         # Get all year/period combinations
         year_periods = [
-            (item.get('school_year'), item.get('period'))
-            for item in metadata_items
-            if item.get('school_year') and item.get('period')
+            (school_year, period)
+            for school_year, period in all_year_periods
+            if school_year and period
         ]
 
-    logger.info(f"Querying across {len(year_periods)} year/period combinations")
+    logger.debug("Querying across %s year/period combinations", len(year_periods))
 
     # STEP 2: Get global metadata to determine what edu+credit combos exist after normalization
-    max_values_response = table.get_item(
-        Key={'PK': 'METADATA#MAXVALUES', 'SK': 'GLOBAL'}
-    )
-
-    if 'Item' not in max_values_response:
-        raise Exception('METADATA#MAXVALUES not found. Run load_salary_data.py first.')
-
-    max_values = max_values_response['Item']
+    max_values = _get_max_values_item(table)
     max_step_global = int(max_values.get('max_step', 15))
     edu_credit_combos = max_values.get('edu_credit_combos', [])
 
-    logger.info(f"Global max_step: {max_step_global}, edu_credit_combos: {edu_credit_combos}")
+    logger.debug("Global max_step: %s, edu_credit_combos: %s", max_step_global, edu_credit_combos)
 
     # STEP 3: Determine best fallback combo from global list
-    edu_order = {'D': 3, 'M': 2, 'B': 1}
-    target_edu_level = edu_order.get(education, 0)
+    target_edu_level = _EDU_ORDER.get(education, 0)
     target_key = f'{education}+{credits}'
 
     # Find best combo to query
@@ -452,26 +703,25 @@ def compare_salaries_across_districts(
     query_cred = credits
     is_exact_match = False
 
-    logger.info(f"Looking for {target_key} in global combos")
+    logger.debug("Looking for %s in global combos", target_key)
 
     # Check if exact combo exists globally
     if target_key in edu_credit_combos:
         is_exact_match = True
-        logger.info(f"Exact match found: {target_key}")
+        logger.debug("Exact match found: %s", target_key)
     elif include_fallback:
-        logger.info(f"Exact match not found, finding fallback for {target_key}")
+        logger.debug("Exact match not found, finding fallback for %s", target_key)
         # Find best fallback from global combos
         best_combo = None
         best_combo_edu = ''
         best_combo_cred = -1
 
         for combo in edu_credit_combos:
-            parts = combo.split('+')
-            if len(parts) != 2:
+            parsed = _parse_edu_credit_combo(combo)
+            if parsed is None:
                 continue
-            combo_edu = parts[0]
-            combo_cred = int(parts[1])
-            combo_edu_level = edu_order.get(combo_edu, 0)
+            combo_edu, combo_cred = parsed
+            combo_edu_level = _EDU_ORDER.get(combo_edu, 0)
 
             # Skip if education is higher than target
             if combo_edu_level > target_edu_level:
@@ -489,7 +739,7 @@ def compare_salaries_across_districts(
                 best_combo_cred = combo_cred
             else:
                 # Compare: prefer higher edu, then higher credit
-                if combo_edu_level > edu_order.get(best_combo_edu, 0):
+                if combo_edu_level > _EDU_ORDER.get(best_combo_edu, 0):
                     best_combo = combo
                     best_combo_edu = combo_edu
                     best_combo_cred = combo_cred
@@ -501,7 +751,7 @@ def compare_salaries_across_districts(
         if best_combo:
             query_edu = best_combo_edu
             query_cred = best_combo_cred
-            logger.info(f"Fallback found: {best_combo} (will query for {query_edu}+{query_cred})")
+            logger.debug("Fallback found: %s (will query for %s+%s)", best_combo, query_edu, query_cred)
         else:
             # No valid fallback found
             logger.error(f"No valid fallback found for {target_key}")
@@ -511,185 +761,111 @@ def compare_salaries_across_districts(
         logger.error(f"Exact match required but {target_key} not in global combos")
         raise ValueError(f'No data available for {education}+{credits} (fallback disabled)')
 
-    logger.info(f"Querying for {query_edu}+{query_cred} step {step} using ComparisonIndex (single query)")
+    logger.debug("Querying for %s+%s step %s using ComparisonIndex (single query)", query_edu, query_cred, step)
 
     # STEP 4: Query ComparisonIndex (GSI5) - ONE query for all districts across all years
-    query_cred_padded = pad_number(int(query_cred), 3)
-    step_padded = pad_number(step, 2)
-
-    response = table.query(
-        IndexName='ComparisonIndex',
-        KeyConditionExpression=Key('GSI_COMP_PK').eq(
-            f'EDU#{query_edu}#CR#{query_cred_padded}#STEP#{step_padded}'
-        )
+    comparison_items = _get_comparison_items(table, query_edu, query_cred, step)
+
+    # STEP 5: Deduplicate by district - keep oldest year/period per district.
+    # Rows without a `district_id` (e.g., metadata returned by the test FakeTable
+    # implementation or by misconfigured GSIs) cannot be ranked and are skipped.
+    # Sorting once by (year, period) lets setdefault keep the first row seen per
+    # district without comparing tuples against the current best on every row.
+    # Missing year/period values fall back to '' to avoid TypeError on comparison.
+    rows_by_year = sorted(
+        (item for item in comparison_items if item.get('district_id')),
+        key=lambda item: (item.get('school_year') or '', item.get('period') or '')
     )
+    retrieved_count = len(rows_by_year)
 
-    all_results = []
-    for item in response.get('Items', []):
-        item['is_exact_match'] = is_exact_match
-        all_results.append(item)
-
-    # Handle pagination
-    while 'LastEvaluatedKey' in response:
-        response = table.query(
-            IndexName='ComparisonIndex',
-            KeyConditionExpression=Key('GSI_COMP_PK').eq(
-                f'EDU#{query_edu}#CR#{query_cred_padded}#STEP#{step_padded}'
-            ),
-            ExclusiveStartKey=response['LastEvaluatedKey']
-        )
-        for item in response.get('Items', []):
-            item['is_exact_match'] = is_exact_match
-            all_results.append(item)
-    # Filter out any non-district rows (e.g., metadata) that may have been
-    # returned by the test FakeTable implementation or by misconfigured GSIs.
-    # We require a `district_id` to perform deduplication and ranking.
-    all_results = [it for it in all_results if it.get('district_id')]
-
-    logger.info(f"Retrieved {len(all_results)} total salary results (single query)")
-
-    # STEP 5: Deduplicate by district - keep oldest year/period per district
     district_best_match = {}
-    for item in all_results:
-        district_id = item.get('district_id')
-        year = item.get('school_year')
-        period = item.get('period')
+    for item in rows_by_year:
+        district_best_match.setdefault(item['district_id'], item)
 
-        if district_id not in district_best_match:
-            district_best_match[district_id] = item
-        else:
-            existing = district_best_match[district_id]
-            existing_year = existing.get('school_year')
-            existing_period = existing.get('period')
-
-            # Keep the older. Use safe fallbacks for missing year/period values
-            # to avoid TypeError when items have None for these fields.
-            year_key = (year or '')
-            period_key = (period or '')
-            existing_year_key = (existing_year or '')
-            existing_period_key = (existing_period or '')
-
-            if (year_key, period_key) < (existing_year_key, existing_period_key):
-                district_best_match[district_id] = item
+    logger.debug("Retrieved %s total salary results (single query)", retrieved_count)
 
     all_results = list(district_best_match.values())
-    logger.info(f"After deduplication: {len(all_results)} districts")
-
-    # FILTER: Only include Municipal and Regional Academic districts
-    # First, we need to fetch district types to filter
-    result_district_ids_unfiltered = [item.get('district_id') for item in all_results]
-
-    # Fetch district types for filtering using simple get_item calls
-    district_types_for_filtering = {}
-
-    if result_district_ids_unfiltered:
-        try:
-            for district_id in result_district_ids_unfiltered:
-                try:
-                    response = table.get_item(
-                        Key={
-                            'PK': f'DISTRICT#{district_id}',
-                            'SK': 'METADATA'
-                        }
-                    )
-                    if 'Item' in response:
-                        district_types_for_filtering[district_id] = response['Item'].get('district_type', 'unknown')
-                    else:
-                        district_types_for_filtering[district_id] = 'unknown'
-                except Exception as item_error:
-                    logger.warning(f"Error fetching district type for {district_id}: {str(item_error)}")
-                    district_types_for_filtering[district_id] = 'unknown'
-        except Exception as e:
-            logger.error(f"Error in district type filtering loop: {str(e)}")
+    logger.debug("After deduplication: %s districts", len(all_results))
+
+    # FILTER: Only include Municipal and Regional Academic districts. One
+    # batched metadata read gives each district's type for the filter and its
+    # type and contract PDF for the response.
+    district_types_map = _get_district_info(
+        table, [item.get('district_id') for item in all_results]
+    )
 
     # Filter to only Municipal and Regional Academic districts
     ALLOWED_DISTRICT_TYPES = {'municipal', 'regional_academic'}
     all_results = [
         item for item in all_results
-        if district_types_for_filtering.get(item.get('district_id'), 'unknown') in ALLOWED_DISTRICT_TYPES
+        if district_types_map.get(item.get('district_id'), _UNKNOWN_DISTRICT_INFO)['district_type'] in ALLOWED_DISTRICT_TYPES
     ]
-    logger.info(f"After filtering to Municipal/Regional: {len(all_results)} districts")
+    logger.debug("After filtering to Municipal/Regional: %s districts", len(all_results))
+
+    # Rank by salary, highest first. Each Decimal salary is converted to float
+    # once here and reused for the response instead of on every comparison.
+    ranked_results = sorted(
+        ((float(item.get('salary') or 0), item) for item in all_results),
+        key=itemgetter(0),
+        reverse=True
+    )
 
-    # STEP 6: Fetch towns and district types for all result districts
+    # STEP 6: Fetch towns for all result districts
     result_district_ids = [item.get('district_id') for item in all_results]
 
+    # Towns are only read for districts that passed the type filter.
+    # BatchGetItem takes at most 100 keys, so each 100-ID chunk is its own task
+    # and the round trips run in parallel rather than one after another.
     from utils.dynamodb import get_district_towns
     tbl_name = getattr(table, 'name', 'TEST_TABLE')
-    district_towns_map = get_district_towns(result_district_ids, tbl_name)
-
-    # Fetch district types using batch_get_item
-    dynamodb = boto3.resource('dynamodb')
-    district_types_map = {}
-
-    if result_district_ids:
-        try:
-            for i in range(0, len(result_district_ids), 100):
-                batch_ids = result_district_ids[i:i+100]
-                keys = [{'PK': f'DISTRICT#{did}', 'SK': 'METADATA'} for did in batch_ids]
-
-                response = dynamodb.batch_get_item(
-                    RequestItems={
-                        tbl_name: {
-                            'Keys': keys
-                        }
-                    }
-                )
-
-                for item in response.get('Responses', {}).get(tbl_name, []):
-                    district_id = item['PK'].replace('DISTRICT#', '')
-                    district_types_map[district_id] = {
-                        'district_type': item.get('district_type', 'unknown'),
-                        'contract_pdf': item.get('contract_pdf')
-                    }
+    towns_futures = [
+        _executor.submit(get_district_towns, result_district_ids[i:i + 100], tbl_name)
+        for i in range(0, len(result_district_ids), 100)
+    ]
 
-                for district_id in batch_ids:
-                    if district_id not in district_types_map:
-                        district_types_map[district_id] = {
-                            'district_type': 'unknown',
-                            'contract_pdf': None
-                        }
-
-        except Exception as e:
-            logger.error(f"Error fetching district types: {str(e)}")
-            for district_id in result_district_ids:
-                district_types_map[district_id] = {
-                    'district_type': 'unknown',
-                    'contract_pdf': None
-                }
+    district_towns_map = {}
+    for towns_future in towns_futures:
+        district_towns_map.update(towns_future.result())
 
     # Transform results for response
+    queried_for = None if is_exact_match else {
+        'education': education,
+        'credits': credits,
+        'step': step
+    }
     rankings = []
-    for index, item in enumerate(all_results):
-        district_id = item.get('district_id')
-        district_info = district_types_map.get(district_id, {'district_type': 'unknown', 'contract_pdf': None})
+    for rank, (salary, item) in enumerate(ranked_results, start=1):
+        # One C-level map over bound dict.get instead of a .get call per field;
+        # optional attributes (e.g. is_calculated_from) may be absent
+        (district_id, district_name, school_year, period, item_education,
+         item_credits, item_step, is_calculated, is_calculated_from) = map(item.get, _RANKING_FIELDS)
+        district_info = district_types_map.get(district_id, _UNKNOWN_DISTRICT_INFO)
         result = {
-            'rank': index + 1,
+            'rank': rank,
             'district_id': district_id,
-            'district_name': item.get('district_name'),
-            'district_type': district_info.get('district_type', 'unknown'),
-            'contract_pdf': district_info.get('contract_pdf'),
-            'school_year': item.get('school_year'),
-            'period': item.get('period'),
-            'education': item.get('education'),
-            'credits': int(item.get('credits', 0)),
-            'step': int(item.get('step', 0)),
-            'salary': float(item.get('salary', 0)),
-            'is_calculated': bool(item.get('is_calculated', False)),
-            'is_calculated_from': item.get('is_calculated_from'),
-            'is_exact_match': item.get('is_exact_match', True),
-            'towns': district_towns_map.get(district_id, [])
+            'district_name': district_name,
+            'district_type': district_info['district_type'],
+            'contract_pdf': district_info['contract_pdf'],
+            'school_year': school_year,
+            'period': period,
+            'education': item_education,
+            'credits': int(item_credits or 0),
+            'step': int(item_step or 0),
+            'salary': salary,
+            'is_calculated': bool(is_calculated),
+            'is_calculated_from': is_calculated_from,
+            'is_exact_match': is_exact_match,
+            'towns': district_towns_map.get(district_id, ())
         }
 
-        if not item.get('is_exact_match', True):
-            result['queried_for'] = {
-                'education': education,
-                'credits': credits,
-                'step': step
-            }
+        if queried_for is not None:
+            # Identical for every fallback row and never mutated, so one dict is shared
+            result['queried_for'] = queried_for
 
         rankings.append(result)
 
-    exact_match_count = sum(1 for r in rankings if r.get('is_exact_match', True))
+    # Every ranking comes from the same query, so they are either all exact or all fallback
+    exact_match_count = len(rankings) if is_exact_match else 0
     fallback_match_count = len(rankings) - exact_match_count
 
     result = {
@@ -714,11 +890,11 @@ def compare_salaries_across_districts(
 
     query_time = time.time() - query_start_time
     if _cache_enabled:
-        _salary_cache[cache_key] = (result, time.time())
-        logger.info(f"Cached comparison query result: {len(rankings)} districts, "
-                   f"query_time={query_time:.3f}s, cache_size={len(_salary_cache)}")
+        _set_cached(cache_key, result)
+        logger.info("Cached comparison query result: %d districts, query_time=%.3fs, cache_size=%d",
+                    len(rankings), query_time, len(_salary_cache))
     else:
-        logger.info(f"Cache DISABLED: {len(rankings)} districts, query_time={query_time:.3f}s")
+        logger.info("Cache DISABLED: %d districts, query_time=%.3fs", len(rankings), query_time)
 
     return result
 
@@ -737,46 +913,54 @@ def get_district_salary_metadata(table, district_id: str) -> Dict[str, Any]:
     if not table:
         raise Exception('DynamoDB table not configured')
 
-    response = table.query(
-        KeyConditionExpression=Key('PK').eq(f'DISTRICT#{district_id}') & Key('SK').begins_with('SCHEDULE#')
+    items = _query_all(
+        table,
+        KeyConditionExpression=Key('PK').eq(f'DISTRICT#{district_id}') & Key('SK').begins_with('SCHEDULE#'),
+        ProjectionExpression='district_name,school_year,period,salary'
     )
 
-    items = response.get('Items', [])
-
     if not items:
         raise ValueError('No salary data found for district')
 
-    years_periods = defaultdict(set)
-    min_salary = float('inf')
-    max_salary = float('-inf')
+    year_periods = set()
+    # items is non-empty here, so seed the range from the first salary and
+    # skip a sentinel check on every comparison
+    min_salary = max_salary = float(items[0].get('salary', 0))
 
+    # Single pass: collect distinct (year, period) pairs and track min and max
+    # with direct comparisons instead of calling min()/max() for every item
     for item in items:
-        year = item.get('school_year')
-        period = item.get('period')
         salary = float(item.get('salary', 0))
+        year_periods.add((item.get('school_year'), item.get('period')))
 
-        years_periods[year].add(period)
-        min_salary = min(min_salary, salary)
-        max_salary = max(max_salary, salary)
+        if salary < min_salary:
+            min_salary = salary
+        elif salary > max_salary:
+            max_salary = salary
 
     district_name = items[0].get('district_name', district_id)
 
+    # Sorted pairs are already in schedule order with each year grouped
+    # together, so the distinct years fall out of the same walk; the latest
+    # year is the last entry
     schedules = []
-    for year in sorted(years_periods.keys()):
-        for period in sorted(years_periods[year]):
-            schedules.append({
-                'school_year': year,
-                'period': period
-            })
+    available_years = []
+    for year, period in sorted(year_periods):
+        schedules.append({
+            'school_year': year,
+            'period': period
+        })
+        if not available_years or available_years[-1] != year:
+            available_years.append(year)
 
     return {
         'district_id': district_id,
         'district_name': district_name,
-        'available_years': sorted(list(years_periods.keys())),
-        'latest_year': max(years_periods.keys()) if years_periods else None,
+        'available_years': available_years,
+        'latest_year': available_years[-1] if available_years else None,
         'salary_range': {
-            'min': min_salary if min_salary != float('inf') else None,
-            'max': max_salary if max_salary != float('-inf') else None
+            'min': min_salary,
+            'max': max_salary
         },
         'schedules': schedules
     }
@@ -0,0 +1,147 @@
+"""
+Tests for the salary JSON loader script
+"""
+import os
+import sys
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = BACKEND_DIR / 'scripts'
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+# The script creates its DynamoDB client at import time
+os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+
+import load_salary_data as loader
+
+
+def _record(**overrides):
+    record = {
+        'district_name': 'Alpha',
+        'school_year': '2023-2024',
+        'period': 'full-year',
+        'education': 'M',
+        'credits': 30,
+        'step': 5,
+        'salary': Decimal('70000'),
+    }
+    record.update(overrides)
+    return record
+
+
+class FakeWriteClient:
+    """Accepts every BatchWriteItem request and records the written keys"""
+
+    def __init__(self):
+        self.keys = []
+
+    def batch_write_item(self, RequestItems):
+        (requests,) = RequestItems.values()
+        self.keys.extend(r['PutRequest']['Item']['SK']['S'] for r in requests)
+        return {}
+
+
+def test_malformed_records_are_skipped_and_metadata_still_built(capsys):
+    records = [
+        _record(step=1),
+        _record(step='not-a-number'),
+        {'district_name': 'Alpha'},
+        _record(salary='n/a'),
+        _record(step=2),
+    ]
+
+    items = list(loader.create_items(records, {'alpha': 'uuid-a'}, 'salaries'))
+
+    salary_items = [i for i in items if i['PK'].startswith('DISTRICT#')]
+    assert [i['step'] for i in salary_items] == [1, 2]
+    assert {i['PK'] for i in items if i['PK'].startswith('METADATA#')} == {
+        'METADATA#SCHEDULES', 'METADATA#AVAILABILITY', 'METADATA#MAXVALUES'
+    }
+    out = capsys.readouterr().out
+    assert 'Skipping malformed salary record #2' in out
+    assert '3 malformed records skipped' in out
+
+
+def test_source_failure_stops_the_load_after_reporting_written_items(monkeypatch, capsys):
+    client = FakeWriteClient()
+    monkeypatch.setattr(loader, 'dynamodb_client', client)
+
+    def items():
+        for n in range(30):
+            yield {'PK': 'DISTRICT#d1', 'SK': f'SCHEDULE#{n:02d}'}
+        raise ValueError('truncated JSON')
+
+    with pytest.raises(ValueError, match='truncated JSON'):
+        loader.batch_write_items('salaries', items(), 'Salary data import')
+
+    # The first full batch was written; the partial second batch was lost
+    assert len(client.keys) == 25
+    out = capsys.readouterr().out
+    assert 'Written: 25' in out
+    assert 'Stopped early, could not read further items: truncated JSON' in out
+
+
+DISTRICTS = {
+    'north andover': 'uuid-north-andover',
+    'whitman-hanson regional': 'uuid-whitman-hanson',
+    'east bridgewater': 'uuid-east-bridgewater',
+    'west bridgewater': 'uuid-west-bridgewater',
+    'ayer shirley regional': 'uuid-ayer-shirley',
+    'lowell': 'uuid-lowell',
+    'marblehead': 'uuid-marblehead',
+    'wareham': 'uuid-wareham',
+    'lee': 'uuid-lee',
+}
+
+
+def _match(name):
+    return loader.match_district_name_to_id(name, DISTRICTS, loader.build_district_lookup(DISTRICTS))
+
+
+def test_canonical_match_ignores_case_punctuation_and_accents():
+    assert _match('  NORTH-ANDOVER ') == ('uuid-north-andover', True)
+    assert _match('Whitman Hanson Régional') == ('uuid-whitman-hanson', True)
+
+
+def test_token_match_requires_a_unique_district_containing_every_token():
+    assert _match('Whitman Hanson') == ('uuid-whitman-hanson', True)
+    # "bridgewater" names two districts, so the token step does not guess
+    assert _match('Bridgewater') == ('Bridgewater', False)
+    # An unknown extra token must not collapse to the known one
+    assert _match('Foo Lowell') == ('Foo Lowell', False)
+
+
+def test_fuzzy_match_accepts_a_clear_winner_and_rejects_a_near_tie(capsys):
+    assert _match('Marblehed') == ('uuid-marblehead', True)
+    # Equally close to "east bridgewater" and "west bridgewater"
+    assert _match('Est Bridgewater') == ('Est Bridgewater', False)
+    assert 'Ambiguous match' in capsys.readouterr().out
+
+
+def test_short_and_single_token_names():
+    assert _match('Lee') == ('uuid-lee', True)
+    # A unique indexed token matches the only district containing it
+    assert _match('Ayer') == ('uuid-ayer-shirley', True)
+    # A short name is not stretched to a longer one that merely contains it
+    assert _match('Ware') == ('Ware', False)
+    assert _match('') == ('', False)
+
+
+def test_fuzzy_fallback_without_rapidfuzz(monkeypatch):
+    monkeypatch.setattr(loader, 'fuzz', None)
+    monkeypatch.setattr(loader, 'fuzz_process', None)
+
+    assert loader._similarity('kitten', 'sitting') == pytest.approx(200 * 4 / 13)
+    assert loader._similarity('', '') == 100.0
+    assert _match('Marblehed') == ('uuid-marblehead', True)
+    assert _match('Est Bridgewater') == ('Est Bridgewater', False)
+
+
+def test_fallback_scores_match_rapidfuzz():
+    rapidfuzz = pytest.importorskip('rapidfuzz')
+    for a, b in [('kitten', 'sitting'), ('est bridgewater', 'west bridgewater'), ('marblehed', 'lowell')]:
+        assert loader._similarity(a, b) == pytest.approx(rapidfuzz.fuzz.ratio(a, b))
@@ -37,6 +37,26 @@ class FakeTable:
         return {'Items': self._items}
 
 
+class FakeClient:
+    """Mock low-level DynamoDB client serving batch_get_item from table items"""
+    def __init__(self, items):
+        from boto3.dynamodb.types import TypeSerializer
+        serializer = TypeSerializer()
+        self._items = {
+            (it['PK'], it['SK']): {k: serializer.serialize(v) for k, v in it.items()}
+            for it in items if 'PK' in it and 'SK' in it
+        }
+        self.batch_calls = []
+
+    def batch_get_item(self, RequestItems):
+        self.batch_calls.append(RequestItems)
+        responses = {}
+        for table_name, request in RequestItems.items():
+            found = (self._items.get((k['PK']['S'], k['SK']['S'])) for k in request['Keys'])
+            responses[table_name] = [it for it in found if it is not None]
+        return {'Responses': responses}
+
+
 def test_compare_salaries_basic(monkeypatch):
     metadata_items = [
         {'PK': 'METADATA#SCHEDULES', 'SK': 'YEAR#2022-2023#PERIOD#full-year', 'school_year': '2022-2023', 'period': 'full-year'},
@@ -82,6 +102,7 @@ def test_compare_salaries_basic(monkeypatch):
 
     all_items = metadata_items + district_metadata_items + exact_items
     monkeypatch.setattr(svc, 'table', FakeTable(all_items))
+    monkeypatch.setattr(svc, '_get_dynamodb_client', lambda: FakeClient(all_items))
 
     resp = svc.compare_salaries_across_districts(FakeTable(all_items), 'M', 30, 5)
     assert resp['total'] == 2
@@ -92,6 +113,39 @@ def test_compare_salaries_basic(monkeypatch):
     assert resp['summary']['fallback_matches'] == 0
 
 
+def test_compare_salaries_ranked_by_salary_desc(monkeypatch):
+    svc.invalidate_comparison_cache()
+    metadata_items = [
+        {'PK': 'METADATA#SCHEDULES', 'SK': 'YEAR#2022-2023#PERIOD#full-year', 'school_year': '2022-2023', 'period': 'full-year'},
+        {'PK': 'METADATA#MAXVALUES', 'SK': 'GLOBAL', 'max_step': 15, 'edu_credit_combos': ['B+0', 'M+30']}
+    ]
+    district_metadata_items = [
+        {'PK': f'DISTRICT#{did}', 'SK': 'METADATA', 'district_type': 'municipal'}
+        for did in ('low', 'high', 'mid')
+    ]
+    # ComparisonIndex returns rows in ascending salary order
+    comparison_items = [
+        {
+            'district_id': did,
+            'district_name': did.title(),
+            'school_year': '2022-2023',
+            'period': 'full-year',
+            'education': 'B',
+            'credits': 0,
+            'step': 3,
+            'salary': Decimal(salary),
+        }
+        for did, salary in (('low', '50000'), ('mid', '60000.50'), ('high', '70000'))
+    ]
+    all_items = metadata_items + district_metadata_items + comparison_items
+    monkeypatch.setattr(svc, '_get_dynamodb_client', lambda: FakeClient(all_items))
+
+    resp = svc.compare_salaries_across_districts(FakeTable(all_items), 'B', 0, 3)
+    assert [r['district_id'] for r in resp['results']] == ['high', 'mid', 'low']
+    assert [r['rank'] for r in resp['results']] == [1, 2, 3]
+    assert resp['results'][1]['salary'] == 60000.5
+
+
 def test_schedule_and_metadata(monkeypatch):
     items = [
         {
@@ -156,4 +210,152 @@ def test_schedule_and_metadata(monkeypatch):
     meta = svc.get_district_salary_metadata(FakeTable(meta_items), 'd1')
     assert meta['latest_year'] == '2023-2024'
     assert meta['salary_range']['min'] == 60000.0
-    assert meta['salary_range']['max'] == 80000.0
\ No newline at end of file
+    assert meta['salary_range']['max'] == 80000.0
+
+
+def test_comparison_index_rows_reused_across_queries(monkeypatch):
+    svc.invalidate_comparison_cache()
+    monkeypatch.setattr(svc, '_cache_enabled', True)
+
+    class CountingTable(FakeTable):
+        comparison_queries = 0
+
+        def query(self, **kwargs):
+            if kwargs.get('IndexName') == 'ComparisonIndex':
+                CountingTable.comparison_queries += 1
+            return super().query(**kwargs)
+
+    items = [
+        {'PK': 'METADATA#SCHEDULES', 'SK': 'YEAR#2022-2023#PERIOD#full-year', 'school_year': '2022-2023', 'period': 'full-year'},
+        {'PK': 'METADATA#MAXVALUES', 'SK': 'GLOBAL', 'max_step': 15, 'edu_credit_combos': ['M+30']},
+        {'PK': 'DISTRICT#d1', 'SK': 'METADATA', 'district_type': 'municipal'},
+        {'district_id': 'd1', 'district_name': 'Alpha', 'school_year': '2022-2023', 'period': 'full-year',
+         'education': 'M', 'credits': 30, 'step': 7, 'salary': Decimal('81000')},
+    ]
+    table = CountingTable(items)
+    monkeypatch.setattr(svc, '_get_dynamodb_client', lambda: FakeClient(items))
+
+    first = svc.compare_salaries_across_districts(table, 'M', 30, 7)
+    second = svc.compare_salaries_across_districts(table, 'M', 30, 7, year_param='2022-2023')
+    assert first['total'] == second['total'] == 1
+    assert CountingTable.comparison_queries == 1
+
+    # A comparison cache hit moves its entry to the back of the eviction order
+    assert svc.compare_salaries_across_districts(table, 'M', 30, 7) is first
+    assert next(reversed(svc._salary_cache)) == 'compare#M#30#7#all#latest#False'
+
+    svc.invalidate_comparison_cache()
+
+
+def test_comparison_towns_only_read_for_ranked_districts(monkeypatch):
+    import utils.dynamodb as ddb_utils
+    svc.invalidate_comparison_cache()
+
+    requested = []
+
+    def fake_get_district_towns(district_ids, table_name):
+        requested.extend(district_ids)
+        return {district_id: ['Town'] for district_id in district_ids}
+
+    monkeypatch.setattr(ddb_utils, 'get_district_towns', fake_get_district_towns)
+
+    items = [
+        {'PK': 'METADATA#SCHEDULES', 'SK': 'YEAR#2022-2023#PERIOD#full-year', 'school_year': '2022-2023', 'period': 'full-year'},
+        {'PK': 'METADATA#MAXVALUES', 'SK': 'GLOBAL', 'max_step': 15, 'edu_credit_combos': ['M+30']},
+        {'PK': 'DISTRICT#d1', 'SK': 'METADATA', 'district_type': 'municipal'},
+        {'PK': 'DISTRICT#d2', 'SK': 'METADATA', 'district_type': 'charter'},
+        {'district_id': 'd1', 'district_name': 'Alpha', 'school_year': '2022-2023', 'period': 'full-year',
+         'education': 'M', 'credits': 30, 'step': 7, 'salary': Decimal('81000')},
+        {'district_id': 'd2', 'district_name': 'Beta', 'school_year': '2022-2023', 'period': 'full-year',
+         'education': 'M', 'credits': 30, 'step': 7, 'salary': Decimal('82000')},
+    ]
+
+    client = FakeClient(items)
+    monkeypatch.setattr(svc, '_get_dynamodb_client', lambda: client)
+
+    class NoGetItemTable(FakeTable):
+        def get_item(self, **kwargs):
+            assert not kwargs['Key']['PK'].startswith('DISTRICT#'), 'district metadata read item by item'
+            return super().get_item(**kwargs)
+
+    result = svc.compare_salaries_across_districts(NoGetItemTable(items), 'M', 30, 7)
+
+    assert [row['district_id'] for row in result['results']] == ['d1']
+    assert result['results'][0]['district_type'] == 'municipal'
+    # Types for the filter and the response come from one batched metadata read
+    assert len(client.batch_calls) == 1
+    keys = client.batch_calls[0]['TEST_TABLE']['Keys']
+    assert sorted(k['PK']['S'] for k in keys) == ['DISTRICT#d1', 'DISTRICT#d2']
+    assert result['results'][0]['towns'] == ['Town']
+    # The charter district is filtered out, so its towns are never read
+    assert requested == ['d1']
+
+    svc.invalidate_comparison_cache()
+
+
+def test_comparison_items_read_through_low_level_client():
+    from types import SimpleNamespace
+    svc.invalidate_comparison_cache()
+
+    calls = []
+
+    class QueryClient:
+        def query(self, **kwargs):
+            calls.append(kwargs)
+            if 'ExclusiveStartKey' not in kwargs:
+                return {
+                    'Items': [{'district_id': {'S': 'd1'}, 'salary': {'N': '81000.5'}, 'step': {'N': '7'}}],
+                    'LastEvaluatedKey': {'PK': {'S': 'next'}}
+                }
+            return {'Items': [{'district_id': {'S': 'd2'}, 'salary': {'N': '79000'}, 'step': {'N': '7'}}]}
+
+    table = SimpleNamespace(name='salaries', meta=SimpleNamespace(client=QueryClient()))
+    items = svc._get_comparison_items(table, 'M', 30, 7)
+
+    assert [i['district_id'] for i in items] == ['d1', 'd2']
+    assert items[0]['salary'] == 81000.5 and isinstance(items[0]['salary'], float)
+    assert calls[0]['TableName'] == 'salaries'
+    assert calls[0]['ExpressionAttributeValues'] == {':pk': {'S': 'EDU#M#CR#030#STEP#07'}}
+    assert calls[1]['ExclusiveStartKey'] == {'PK': {'S': 'next'}}
+
+    svc.invalidate_comparison_cache()
+
+
+def test_schedule_cache_respects_cache_switch(monkeypatch):
+    items = [{
+        'PK': 'DISTRICT#d9', 'SK': 'SCHEDULE#2023-2024#full-year#EDU#B#CR#000#STEP#01',
+        'district_id': 'd9', 'school_year': '2023-2024', 'period': 'full-year',
+        'education': 'B', 'credits': 0, 'step': 1, 'salary': Decimal('50000')
+    }]
+
+    class CountingTable(FakeTable):
+        queries = 0
+
+        def query(self, **kwargs):
+            CountingTable.queries += 1
+            return super().query(**kwargs)
+
+    monkeypatch.setattr(svc, '_salary_cache', {})
+    monkeypatch.setattr(svc, '_cache_enabled', True)
+    svc.get_salary_schedule_for_district_optimized(CountingTable(items), 'd9')
+    svc.get_salary_schedule_for_district_optimized(CountingTable(items), 'd9')
+    assert CountingTable.queries == 1
+
+    monkeypatch.setattr(svc, '_salary_cache', {})
+    monkeypatch.setattr(svc, '_cache_enabled', False)
+    svc.get_salary_schedule_for_district_optimized(CountingTable(items), 'd9')
+    svc.get_salary_schedule_for_district_optimized(CountingTable(items), 'd9')
+    assert CountingTable.queries == 3
+
+
+def test_unknown_log_level_falls_back_to_info(monkeypatch):
+    import importlib.util
+    import logging
+
+    monkeypatch.setenv('LOG_LEVEL', 'verbose')
+    spec = importlib.util.spec_from_file_location('salary_service_log_level_check', svc.__file__)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    assert module.logger.level == logging.INFO
+    module._executor.shutdown(wait=False)
@@ -351,3 +351,47 @@ def test_update_district_validation(monkeypatch):
     
     r = client.put('/api/districts/DISTRICT%23123', json=payload)
     assert r.status_code == 200
+
+
+def test_safe_text_check_matches_pattern():
+    """Translate-based safe-text check accepts exactly what SAFE_TEXT_PATTERN accepts"""
+    import schemas
+
+    samples = [chr(c) for c in range(128)] + [
+        'Boston', "O'Brien & Sons, Inc.", 'Acton—Boxborough', 'Unit #4 (rear): A/B',
+        'Non breaking', 'Café', '<script>', 'semi;colon', '',
+        'Ideographic\u3000space', 'Line\u2028sep', 'En\u2002quad', 'Zero\u200bwidth', 'Smart\u2019quote'
+    ]
+    for sample in samples:
+        assert schemas._is_safe_text(sample) == bool(schemas.SAFE_TEXT_PATTERN.fullmatch(sample)), repr(sample)
+
+
+def test_towns_are_stripped_and_deduplicated():
+    """Duplicate and blank town entries are dropped, keeping first-seen order"""
+    district = DistrictCreate(
+        name='Valid District',
+        district_type='municipal',
+        towns=[' Boston', 'Cambridge', 'Boston ', '', '   ', 'Cambridge']
+    )
+    assert district.towns == ['Boston', 'Cambridge']
+
+
+def test_district_type_is_normalized_before_literal_check():
+    """District type input is stripped and lowercased, blanks and unknown types are rejected"""
+    assert DistrictCreate(name='Valid District', district_type='  Regional_Academic ').district_type == 'regional_academic'
+    assert DistrictUpdate(district_type=None).district_type is None
+
+    with pytest.raises(ValidationError, match='District type cannot be empty'):
+        DistrictCreate(name='Valid District', district_type='   ')
+    with pytest.raises(ValidationError, match='Invalid district type: suburban. Allowed types: charter, county_agricultural'):
+        DistrictUpdate(district_type=' Suburban')
+
+
+def test_towns_error_names_the_offending_town():
+    """A bad entry is still reported by name after the single-pass check fails"""
+    with pytest.raises(ValidationError, match='Town name contains invalid characters: Bad<Town>'):
+        DistrictCreate(
+            name='Valid District',
+            district_type='municipal',
+            towns=['Boston', 'Bad<Town>', 'Cambridge']
+        )
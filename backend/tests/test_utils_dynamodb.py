@@ -0,0 +1,90 @@
+"""
+Tests for DynamoDB utility functions
+"""
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from utils import dynamodb as ddb_utils
+
+
+class FakeClient:
+    """Records batch_get_item calls and returns towns for requested districts"""
+
+    def __init__(self, towns_by_id):
+        self.towns_by_id = towns_by_id
+        self.requested = []
+
+    def batch_get_item(self, RequestItems):
+        (table_name, request), = RequestItems.items()
+        ids = [key['PK']['S'].replace('DISTRICT#', '') for key in request['Keys']]
+        self.requested.append(ids)
+        return {
+            'Responses': {
+                table_name: [
+                    {
+                        'district_id': {'S': district_id},
+                        'towns': {'L': [{'S': town} for town in self.towns_by_id[district_id]]}
+                    }
+                    for district_id in ids if district_id in self.towns_by_id
+                ]
+            }
+        }
+
+
+class TestGetDistrictTowns:
+    """Tests for get_district_towns function"""
+
+    def test_returns_empty_without_table_or_ids(self):
+        assert ddb_utils.get_district_towns([], 'districts') == {}
+        assert ddb_utils.get_district_towns(['d1'], '') == {}
+
+    def test_repeat_ids_served_from_cache(self, monkeypatch):
+        client = FakeClient({'d1': ['Alpha'], 'd2': ['Beta', 'Gamma']})
+        monkeypatch.setattr(ddb_utils, '_dynamodb_client', client)
+        monkeypatch.setattr(ddb_utils, '_towns_cache', {})
+
+        first = ddb_utils.get_district_towns(['d1', 'd2'], 'districts')
+        second = ddb_utils.get_district_towns(['d2', 'd1', 'd3'], 'districts')
+
+        assert first == {'d1': ['Alpha'], 'd2': ['Beta', 'Gamma']}
+        assert second == {'d1': ['Alpha'], 'd2': ['Beta', 'Gamma']}
+        # Only the uncached district is fetched on the second call
+        assert client.requested == [['d1', 'd2'], ['d3']]
+
+    def test_cached_towns_are_not_shared_between_callers(self, monkeypatch):
+        client = FakeClient({'d1': ['Alpha']})
+        monkeypatch.setattr(ddb_utils, '_dynamodb_client', client)
+        monkeypatch.setattr(ddb_utils, '_towns_cache', {})
+
+        ddb_utils.get_district_towns(['d1'], 'districts')['d1'].append('Mutated')
+        ddb_utils.get_district_towns(['d1'], 'districts')['d1'].append('Mutated')
+
+        assert ddb_utils.get_district_towns(['d1'], 'districts') == {'d1': ['Alpha']}
+        assert client.requested == [['d1']]
+
+    def test_cache_evicts_least_recently_used_entry(self, monkeypatch):
+        client = FakeClient({'d1': ['Alpha'], 'd2': ['Beta'], 'd3': ['Gamma']})
+        monkeypatch.setattr(ddb_utils, '_dynamodb_client', client)
+        monkeypatch.setattr(ddb_utils, '_towns_cache', {})
+        monkeypatch.setattr(ddb_utils, '_towns_cache_max_entries', 2)
+
+        ddb_utils.get_district_towns(['d1', 'd2'], 'districts')
+        ddb_utils.get_district_towns(['d1'], 'districts')  # d1 is now most recently used
+        ddb_utils.get_district_towns(['d3'], 'districts')  # evicts d2
+
+        assert list(ddb_utils._towns_cache) == [('districts', 'd1'), ('districts', 'd3')]
+
+    def test_expired_entries_are_refetched(self, monkeypatch):
+        client = FakeClient({'d1': ['Alpha']})
+        monkeypatch.setattr(ddb_utils, '_dynamodb_client', client)
+        monkeypatch.setattr(ddb_utils, '_towns_cache', {})
+        monkeypatch.setattr(ddb_utils, '_towns_cache_ttl_seconds', 0)
+
+        ddb_utils.get_district_towns(['d1'], 'districts')
+        ddb_utils.get_district_towns(['d1'], 'districts')
+
+        assert client.requested == [['d1'], ['d1']]
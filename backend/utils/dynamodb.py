@@ -1,12 +1,46 @@
 """
 DynamoDB utility functions for batch operations and common queries
 """
+import os
+import time
 import boto3
 import logging
 from typing import Dict, List
 
+from config import DYNAMODB_CLIENT_CONFIG
+
 logger = logging.getLogger(__name__)
 
+# Client is created on first use and reused across warm invocations so its
+# pooled connections survive between requests
+_dynamodb_client = None
+
+
+def _get_dynamodb_client():
+    """Return the shared low-level DynamoDB client"""
+    global _dynamodb_client
+    if _dynamodb_client is None:
+        _dynamodb_client = boto3.client('dynamodb', config=DYNAMODB_CLIENT_CONFIG)
+    return _dynamodb_client
+
+
+# Towns rarely change, so warm invocations serve repeat district IDs from a
+# per-container cache. Entries expire after DISTRICT_TOWNS_CACHE_TTL seconds;
+# once DISTRICT_TOWNS_CACHE_MAX_ENTRIES is reached the least recently used
+# entry is evicted. Towns are stored as tuples and every caller gets its own
+# list, so mutating a result cannot corrupt later responses.
+_towns_cache: Dict[tuple, tuple] = {}
+_towns_cache_ttl_seconds = int(os.getenv('DISTRICT_TOWNS_CACHE_TTL', '300'))
+_towns_cache_max_entries = int(os.getenv('DISTRICT_TOWNS_CACHE_MAX_ENTRIES', '4096'))
+
+
+def _cache_towns(cache_key: tuple, towns: List[str], now: float) -> None:
+    """Store a copy of a district's towns, evicting the oldest entries when full"""
+    _towns_cache.pop(cache_key, None)
+    while _towns_cache and len(_towns_cache) >= _towns_cache_max_entries:
+        _towns_cache.pop(next(iter(_towns_cache)), None)
+    _towns_cache[cache_key] = (tuple(towns), now)
+
 
 def get_district_towns(district_ids: List[str], districts_table_name: str) -> Dict[str, List[str]]:
     """
@@ -24,10 +58,27 @@ def get_district_towns(district_ids: List[str], districts_table_name: str) -> Di
         return {}
 
     district_towns = {}
+    now = time.time()
+
+    # Serve what we can from the cache and only fetch the remaining IDs
+    missing_ids = []
+    for district_id in dict.fromkeys(district_ids):
+        cache_key = (districts_table_name, district_id)
+        cached = _towns_cache.get(cache_key)
+        if cached is not None and now - cached[1] < _towns_cache_ttl_seconds:
+            # Move to the end so eviction drops the least recently used entry
+            _towns_cache[cache_key] = _towns_cache.pop(cache_key, cached)
+            district_towns[district_id] = list(cached[0])
+        else:
+            missing_ids.append(district_id)
+
+    if not missing_ids:
+        return district_towns
+    district_ids = missing_ids
 
     try:
         # Use DynamoDB client for batch_get_item
-        client = boto3.client('dynamodb')
+        client = _get_dynamodb_client()
         logger.info(f"Fetching towns for {len(district_ids)} districts")
 
         # Batch get items (max 100 at a time)
@@ -47,7 +98,8 @@ def get_district_towns(district_ids: List[str], districts_table_name: str) -> Di
             response = client.batch_get_item(
                 RequestItems={
                     districts_table_name: {
-                        'Keys': keys
+                        'Keys': keys,
+                        'ProjectionExpression': 'district_id,towns'
                     }
                 }
             )
@@ -69,6 +121,8 @@ def get_district_towns(district_ids: List[str], districts_table_name: str) -> Di
 
                 if district_id:
                     district_towns[district_id] = towns
+                    if _towns_cache_ttl_seconds > 0:
+                        _cache_towns((districts_table_name, district_id), towns, now)
                     logger.debug(f"  {district_id}: {towns}")
 
         logger.info(f"Returning {len(district_towns)} district->towns mappings")
@@ -5,6 +5,14 @@ import json
 from typing import Any, Dict
 from .serialization import decimal_to_float
 
+# Headers shared by every response; copied per call so callers can mutate theirs
+_DEFAULT_HEADERS = {
+    'Content-Type': 'application/json',
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type'
+}
+
 
 def create_response(status_code: int, body: Any, additional_headers: Dict[str, str] = None) -> Dict[str, Any]:
     """
@@ -18,12 +26,7 @@ def create_response(status_code: int, body: Any, additional_headers: Dict[str, s
     Returns:
         Dict formatted for API Gateway Lambda proxy integration
     """
-    headers = {
-        'Content-Type': 'application/json',
-        'Access-Control-Allow-Origin': '*',
-        'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
-        'Access-Control-Allow-Headers': 'Content-Type'
-    }
+    headers = dict(_DEFAULT_HEADERS)
 
     if additional_headers:
         headers.update(additional_headers)